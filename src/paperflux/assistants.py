@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Optional
 
 from .config import Config
-from .providers import ProgressCallback, get_provider
+from .providers import LLMProvider, ProgressCallback, TokenCallback, get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,20 @@ async def analyze_pdf(
     path: Path,
     cfg: Config,
     progress_callback: Optional[ProgressCallback] = None,
+    token_callback: Optional[TokenCallback] = None,
+    provider: Optional[LLMProvider] = None,
 ) -> dict:
-    """Analyze a PDF with the configured provider and return quotes + summary."""
-    provider = get_provider(cfg.provider)
-    return await provider.analyze_pdf(path, cfg, progress_callback=progress_callback)
+    """Analyze a PDF with the configured provider and return quotes + summary.
+
+    When *token_callback* is given, summary text is passed to it incrementally
+    as the provider streams it back. Pass a *provider* instance to reuse its
+    API client across calls; otherwise a fresh one is built from ``cfg.provider``.
+    """
+    if provider is None:
+        provider = get_provider(cfg.provider)
+    return await provider.analyze_pdf(
+        path,
+        cfg,
+        progress_callback=progress_callback,
+        token_callback=token_callback,
+    )
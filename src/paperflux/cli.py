@@ -1,6 +1,5 @@
 """CLI entry point for PaperFlux."""
 
-import asyncio
 import json
 import logging
 import os
@@ -8,14 +7,17 @@ import sys
 import time
 from importlib.resources import files
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from pydantic import ValidationError
 
 from . import __version__
-from .config import Config, load
-from .orchestrator import batch_process
+
+# The config and pipeline modules pull in pydantic, PyMuPDF and Jinja2; they
+# are imported inside the command bodies so --help, --version and argument
+# errors stay fast.
+if TYPE_CHECKING:
+    from .config import Config
 
 app = typer.Typer(add_completion=False)
 _COMMANDS = {"run", "init"}
@@ -32,7 +34,14 @@ _INIT_TEMPLATE_FILES = (
 )
 
 
-def _apply_cli_overrides(cfg: Config, *, detail: Optional[str] = None) -> Config:
+async def batch_process(*args, **kwargs):
+    """Import the orchestrator on first use and delegate to its ``batch_process``."""
+    from .orchestrator import batch_process as _batch_process
+
+    return await _batch_process(*args, **kwargs)
+
+
+def _apply_cli_overrides(cfg: "Config", *, detail: Optional[str] = None) -> "Config":
     """Return a new Config with any provided CLI flag values applied.
 
     Re-validates through the Pydantic model so that downstream code sees a
@@ -41,6 +50,8 @@ def _apply_cli_overrides(cfg: Config, *, detail: Optional[str] = None) -> Config
     if detail is None:
         return cfg
 
+    from .config import Config
+
     cfg_data = cfg.model_dump()
     cfg_data["ui"]["detail_level"] = detail
     updated_cfg = Config(**cfg_data)
@@ -86,15 +97,32 @@ def _format_elapsed(seconds: float) -> str:
 
 
 class _StageProgress:
-    """Callable progress reporter that prefixes each message with elapsed time."""
+    """Callable progress reporter that prefixes each message with elapsed time.
+
+    Streamed summary tokens are echoed inline via :meth:`echo_token`; the next
+    stage message starts on a fresh line.
+    """
 
     def __init__(self) -> None:
         self._started_at = time.monotonic()
+        self._mid_line = False
 
     def __call__(self, message: str) -> None:
+        self.end_line()
         elapsed = _format_elapsed(time.monotonic() - self._started_at)
         typer.echo(f"  {elapsed} {message}")
 
+    def echo_token(self, token: str) -> None:
+        """Print a streamed summary token without a trailing newline."""
+        typer.echo(token, nl=False)
+        self._mid_line = True
+
+    def end_line(self) -> None:
+        """Terminate a partially printed token stream, if any."""
+        if self._mid_line:
+            typer.echo()
+            self._mid_line = False
+
 
 def _echo_run_context(
     *,
@@ -159,6 +187,8 @@ def _echo_quote_match_report(report_path: Path, *, verbose: bool = False) -> Non
 
     _echo_section("Quote Matches")
     typer.echo(f"- Summary: {matched}/{total} matched, {skipped} skipped")
+    if report.get("pdf_saved") is False:
+        typer.echo("- Annotated PDF: not written, saving failed (see log)")
     if method_counts:
         methods = ", ".join(
             f"{method} {count}" for method, count in sorted(method_counts.items())
@@ -273,6 +303,7 @@ def main(
     output_dir: Optional[str] = typer.Option(None, "--output-dir", "-o", help="Directory to write outputs"),
     progress: bool = typer.Option(True, "--progress/--no-progress", help="Show stage-level progress updates"),
     quotes_file: Optional[str] = typer.Option(None, "--quotes-file", help="Path to JSON quotes file to annotate without rerunning extraction"),
+    stream_summary: bool = typer.Option(False, "--stream-summary", help="Print the summary as it is generated"),
 ):
     """Analyze one or more PDF files and produce annotated PDFs and markdown summaries.
 
@@ -297,11 +328,18 @@ def main(
         typer.echo(f"Configuration file {config_path} does not exist.")
         raise typer.Exit(code=1)
 
+    pdf_sizes: List[int] = []
     for pdf_path in pdf_paths:
-        if not pdf_path.exists():
+        try:
+            pdf_sizes.append(pdf_path.stat().st_size)
+        except OSError:
             typer.echo(f"PDF file {pdf_path} does not exist.")
             raise typer.Exit(code=1)
     
+    from pydantic import ValidationError
+
+    from .config import load
+
     try:
         cfg: Config = load(config_path)
     except ValueError as exc:
@@ -322,7 +360,7 @@ def main(
         output_dir_path.mkdir(parents=True, exist_ok=True)
 
     if quotes_file:
-        from .utils import finalize_output
+        from .utils import finalize_output, json_loads
         if len(pdf_paths) != 1:
             typer.echo("--quotes-file can be used with exactly one PDF.", err=True)
             raise typer.Exit(code=1)
@@ -342,7 +380,7 @@ def main(
         try:
             if progress_reporter:
                 progress_reporter(f"Loading saved quotes from {quotes_path.name}")
-            quotes_payload = json.loads(quotes_path.read_text())
+            quotes_payload = json_loads(quotes_path.read_bytes())
         except Exception as exc:
             typer.echo(f"Failed to read quotes file: {exc}", err=True)
             raise typer.Exit(code=1)
@@ -365,6 +403,14 @@ def main(
         _echo_quote_match_report(match_report_out, verbose=verbose)
         return
 
+    # Largest PDFs first: their upload/indexing takes longest, so starting them
+    # early shortens the overall run when PDFs are processed concurrently.
+    pdf_paths = [
+        pdf_path
+        for _, pdf_path in sorted(
+            zip(pdf_sizes, pdf_paths), key=lambda item: item[0], reverse=True
+        )
+    ]
     _echo_run_context(
         config_path=config_path,
         pdf_paths=pdf_paths,
@@ -374,6 +420,9 @@ def main(
     _echo_section("Processing")
     typer.echo(f"- Processing {_format_plural(len(pdf_paths), 'PDF')}")
     progress_reporter = _StageProgress() if progress else None
+    token_reporter = (progress_reporter or _StageProgress()) if stream_summary else None
+    import asyncio
+
     try:
         results = asyncio.run(
             batch_process(
@@ -383,8 +432,11 @@ def main(
                 output_dir=output_dir_path,
                 show_progress=progress,
                 progress_callback=progress_reporter,
+                token_callback=token_reporter.echo_token if token_reporter else None,
             )
         )
+        if token_reporter:
+            token_reporter.end_line()
         for pdf_out, md_out, quotes_out, match_report_out in results:
             _echo_output_paths(pdf_out, md_out, quotes_out, match_report_out)
             _echo_quote_match_report(match_report_out, verbose=verbose)
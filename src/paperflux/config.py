@@ -9,29 +9,38 @@ at load time.
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Literal, Set
+from typing import Dict, List, Optional, Union, Literal, Set, Tuple
 
 from dotenv import load_dotenv
 import yaml
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 load_dotenv()
 
 
 class OpenAIConfig(BaseModel):
     """OpenAI API configuration."""
+    model_config = ConfigDict(frozen=True)
     api_key: str
     model: str
+    max_parallel: int = Field(default=8, ge=1)
 
 
 class AnthropicConfig(BaseModel):
     """Anthropic (Claude) API configuration."""
+    model_config = ConfigDict(frozen=True)
     api_key: str
     model: str
 
 
 class UIConfig(BaseModel):
     """Display and inference settings that control output verbosity, reasoning depth, and highlight colors."""
+    model_config = ConfigDict(frozen=True)
     detail_level: Literal["low", "medium", "high"] = "medium"
     reasoning_effort: Literal["none", "low", "medium", "high", "xhigh"] = "medium"
     verbosity: Literal["low", "medium", "high"] = "medium"
@@ -48,6 +57,7 @@ class UIConfig(BaseModel):
 
 class ExtractionCategoriesConfig(BaseModel):
     """Named categories used to guide quote extraction, mapping each name to a natural-language description."""
+    model_config = ConfigDict(frozen=True)
 
     categories: Dict[str, str] = Field(
         default_factory=lambda: {
@@ -61,12 +71,26 @@ class ExtractionCategoriesConfig(BaseModel):
 
 class MatchingConfig(BaseModel):
     """Quote matching configuration."""
+    model_config = ConfigDict(frozen=True)
     min_similarity: float = Field(default=0.88, ge=0.0, le=1.0)
     max_window_tokens: int = Field(default=80, ge=8)
+    # Stop searching further pages for a quote after this many exact matches;
+    # None searches every page for the best-scoring match.
+    max_exact_matches_per_quote: Optional[int] = Field(default=None, ge=1)
+
+
+class IOConfig(BaseModel):
+    """Annotated PDF output configuration."""
+    model_config = ConfigDict(frozen=True)
+    # PyMuPDF ``garbage`` level for the annotated PDF: 0 appends the annotations
+    # to a copy of the input (incremental save, fastest); 1-4 rewrite the file,
+    # with 4 running the full unused-object and duplicate sweep.
+    save_garbage_level: int = Field(default=0, ge=0, le=4)
 
 
 class RagConfig(BaseModel):
     """RAG retrieval and summarization configuration."""
+    model_config = ConfigDict(frozen=True)
 
     category_prompt_file: str = "prompts/rag_category_prompt.j2"
     summary_prompt_file: str = "prompts/rag_summary_prompt.j2"
@@ -90,6 +114,7 @@ class Config(BaseModel):
     ui: UIConfig
     extraction_categories: ExtractionCategoriesConfig = Field(default_factory=ExtractionCategoriesConfig)
     matching: MatchingConfig = Field(default_factory=MatchingConfig)
+    io: IOConfig = Field(default_factory=IOConfig)
     rag: RagConfig = Field(default_factory=RagConfig)
 
     @model_validator(mode="after")
@@ -145,25 +170,71 @@ def _expand_env_vars(value: str) -> str:
     return value
 
 
-def _process_config_dict(config_dict: dict) -> dict:
-    """Recursively walk a config dict and resolve all ``ENV:`` sentinels in string values."""
-    for key, value in config_dict.items():
-        if isinstance(value, dict):
-            config_dict[key] = _process_config_dict(value)
-        elif isinstance(value, str):
-            config_dict[key] = _expand_env_vars(value)
+def _process_config_dict(
+    config_dict: dict, referenced_env: Optional[List[str]] = None
+) -> dict:
+    """Walk a nested config dict in place and resolve all ``ENV:`` sentinels in string values.
+
+    Uses an explicit stack rather than recursion, and only calls
+    :func:`_expand_env_vars` for strings that actually carry the prefix. Names
+    of resolved variables are appended to *referenced_env* when it is given.
+    """
+    stack = [config_dict]
+    while stack:
+        current = stack.pop()
+        for key, value in current.items():
+            if type(value) is dict:
+                stack.append(value)
+            elif type(value) is str and value[:4] == "ENV:":
+                current[key] = _expand_env_vars(value)
+                if referenced_env is not None:
+                    referenced_env.append(value[4:])
     return config_dict
 
 
+# resolved path -> (mtime_ns, size, config, snapshot of referenced env vars).
+# Keyed on the path alone so an edited file replaces its previous entry.
+_LOAD_CACHE: Dict[str, Tuple[int, int, "Config", Tuple[Tuple[str, str], ...]]] = {}
+
+
+def _load_uncached(config_path: Path) -> Tuple[Config, Tuple[Tuple[str, str], ...]]:
+    """Parse and validate *config_path*, returning the config and its env-var snapshot."""
+    with open(config_path, "rb") as f:
+        config_dict = yaml.load(f, Loader=_SafeLoader)
+
+    if isinstance(config_dict, dict):
+        selected_provider = config_dict.get("provider", "openai")
+        for name in _PROVIDER_CONFIG_KEYS:
+            if name != selected_provider:
+                config_dict.pop(name, None)
+
+    referenced_env: List[str] = []
+    config_dict = _process_config_dict(config_dict, referenced_env)
+
+    cfg = Config(**config_dict)
+    # Resolved, like the cache key, so a cached config shared across working
+    # directories still resolves prompt paths against the file's own directory.
+    cfg._config_dir = config_path.resolve().parent
+    env_snapshot = tuple((name, os.environ[name]) for name in referenced_env)
+    return cfg, env_snapshot
+
+
 def load(config_path: Union[str, Path]) -> Config:
     """Load and validate a YAML configuration file.
 
     Provider-specific blocks for inactive providers are discarded before
     environment-variable resolution so that credentials for unused providers
     need not be present. The returned object's ``_config_dir`` private
-    attribute is set to the directory containing the file, for use when
+    attribute is set to the absolute directory containing the file, for use when
     resolving relative paths (e.g. prompt template files).
 
+    One validated config is cached per file path and reused while the file's
+    modification time and size are unchanged, so repeated loads cost one
+    ``stat``. An edited file, or a change to any ``ENV:`` variable the entry
+    resolved, replaces the cached entry. The
+    returned object may be shared between callers and should be treated as
+    read-only.
+
     Args:
         config_path: Path to the YAML configuration file.
 
@@ -176,20 +247,22 @@ def load(config_path: Union[str, Path]) -> Config:
             config section is missing or invalid.
     """
     config_path = Path(config_path)
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config_dict = yaml.safe_load(f)
-
-    if isinstance(config_dict, dict):
-        selected_provider = config_dict.get("provider", "openai")
-        for name in _PROVIDER_CONFIG_KEYS:
-            if name != selected_provider:
-                config_dict.pop(name, None)
-
-    config_dict = _process_config_dict(config_dict)
-
-    cfg = Config(**config_dict)
-    cfg._config_dir = config_path.parent
+    cache_key = str(config_path.resolve())
+    cached = _LOAD_CACHE.get(cache_key)
+    if cached is not None:
+        mtime_ns, size, cfg, env_snapshot = cached
+        if (
+            mtime_ns == stat.st_mtime_ns
+            and size == stat.st_size
+            and all(os.environ.get(name) == value for name, value in env_snapshot)
+        ):
+            return cfg
+
+    cfg, env_snapshot = _load_uncached(config_path)
+    _LOAD_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, cfg, env_snapshot)
     return cfg
@@ -3,6 +3,10 @@ PDF I/O operations for PaperFlux.
 Handles text extraction and PDF annotation.
 """
 
+import functools
+import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -11,7 +15,7 @@ import logging
 
 import fitz  # PyMuPDF
 from .config import Config
-from .quote_locator import locate_quote_in_document
+from .quote_locator import PageTokens, QuoteQuery, locate_quotes_in_document
 
 logger = logging.getLogger(__name__)
 
@@ -26,19 +30,22 @@ class _QuotePayload:
     suffix: str = ""
 
 
+_WRAPPING_QUOTE_PAIRS = (
+    ("“", "”"),
+    ("‘", "’"),
+    ("'", "'"),
+    ('"', '"'),
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def _strip_wrapping_quotes(text: str) -> str:
     """Remove a single layer of wrapping quote characters."""
     if not text:
         return text
 
     trimmed = text.strip()
-    quote_pairs = [
-        ("“", "”"),
-        ("‘", "’"),
-        ("'", "'"),
-        ('"', '"'),
-    ]
-    for left, right in quote_pairs:
+    for left, right in _WRAPPING_QUOTE_PAIRS:
         if trimmed.startswith(left) and trimmed.endswith(right) and len(trimmed) > len(left) + len(right):
             trimmed = trimmed[len(left):-len(right)].strip()
             break
@@ -69,6 +76,80 @@ def _coerce_quote_payload(raw: Any) -> Optional[_QuotePayload]:
     return None
 
 
+def _open_for_annotation(
+    path: Path, output_path: Path, save_garbage_level: int
+) -> Tuple[fitz.Document, Optional[Path]]:
+    """Open the document to annotate and return it with its temporary copy, if any.
+
+    *path* is always opened first, so unreadable inputs fail before anything is
+    written next to the output. Without a garbage sweep the input is then copied
+    to a temporary file beside *output_path* and annotated there, so saving only
+    appends the new objects instead of rewriting the whole file. Documents
+    PyMuPDF cannot save incrementally (e.g. repaired files) are returned as
+    opened from *path* for a full save, with no temporary copy.
+    """
+    doc = fitz.open(path)
+    if save_garbage_level != 0:
+        return doc, None
+    if not doc.can_save_incrementally():
+        logger.debug("PDF cannot be saved incrementally, falling back to a full save")
+        return doc, None
+
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{output_path.stem}.", suffix=".tmp", dir=output_path.parent
+    )
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        shutil.copyfile(path, temp_path)
+        copy = fitz.open(temp_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        doc.close()
+    return copy, temp_path
+
+
+def _save_annotated_pdf(
+    doc: fitz.Document,
+    output_path: Path,
+    temp_path: Optional[Path],
+    save_garbage_level: int,
+) -> bool:
+    """Write *doc* to *output_path*, close it, and report whether a PDF was written.
+
+    With a temporary copy the annotations are appended to it and the copy then
+    replaces *output_path*; a failed incremental save falls back to rewriting the
+    whole copy. The temporary copy is removed whenever the save fails, leaving
+    any previous output untouched.
+    """
+    try:
+        if temp_path is not None:
+            try:
+                # Only the new annotation objects are appended to the copied input.
+                doc.save(temp_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+                doc.close()
+            except Exception as e:
+                logger.warning(f"Incremental save failed ({e}), rewriting the full PDF")
+                data = doc.tobytes(garbage=save_garbage_level, deflate=True, clean=False)
+                doc.close()
+                temp_path.write_bytes(data)
+            os.replace(temp_path, output_path)
+        else:
+            doc.save(output_path, garbage=save_garbage_level, deflate=True, clean=False)
+        logger.info("PDF saved successfully")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving PDF: {str(e)}")
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+        return False
+    finally:
+        if not doc.is_closed:
+            doc.close()
+
+
 def annotate_pdf(
     path: Path, 
     quotes: Dict[str, List[Any]], 
@@ -89,8 +170,9 @@ def annotate_pdf(
         output_dir: Optional directory where the annotated PDF should be saved
 
     Returns:
-        The path of the saved annotated PDF and a match report summarising how
-        many quotes were located, highlighted, or skipped.
+        The path of the annotated PDF and a match report summarising how many
+        quotes were located, highlighted, or skipped. The report's ``pdf_saved``
+        flag is false when the PDF could not be written.
     """
     if colors is None and cfg is not None and hasattr(cfg, "ui") and hasattr(cfg.ui, "highlight_colors"):
         colors = cfg.ui.highlight_colors
@@ -100,13 +182,21 @@ def annotate_pdf(
         colors = {}
     min_similarity = 0.88
     max_window_tokens = 80
-    word_cache: Dict[int, List[List[Any]]] = {}
+    max_exact_matches: Optional[int] = None
+    # Per-page tokens shared by every quote; lives as long as ``doc``.
+    page_cache: Dict[int, PageTokens] = {}
     if cfg is not None and hasattr(cfg, "matching"):
         try:
             min_similarity = getattr(cfg.matching, "min_similarity", min_similarity)
             max_window_tokens = getattr(cfg.matching, "max_window_tokens", max_window_tokens)
+            max_exact_matches = getattr(
+                cfg.matching, "max_exact_matches_per_quote", max_exact_matches
+            )
         except AttributeError:
             pass
+    save_garbage_level = 0
+    if cfg is not None and hasattr(cfg, "io"):
+        save_garbage_level = getattr(cfg.io, "save_garbage_level", save_garbage_level)
 
     logger.debug(
         "Using local quote locator (min_similarity=%.2f, max_window_tokens=%s)",
@@ -114,98 +204,120 @@ def annotate_pdf(
         max_window_tokens,
     )
 
+    stem = path.stem
+    target_dir = output_dir if output_dir else path.parent
+    if output_dir:
+        target_dir.mkdir(parents=True, exist_ok=True)
+    output_path = target_dir / f"{stem}_annotated.pdf"
+
     logger.debug(f"Opening PDF for annotation: {path}")
-    doc = fitz.open(path)
-    logger.info(f"PDF has {len(doc)} pages")
+    doc, temp_path = _open_for_annotation(path, output_path, save_garbage_level)
+    try:
+        logger.info(f"PDF has {len(doc)} pages")
     
-    first_page = doc[0]
-    logger.debug(f"Adding sticky note with {len(note_md)} characters")
-    logger.debug(f"Note content preview: {note_md[:100]}...")
+        first_page = doc[0]
+        logger.debug(f"Adding sticky note with {len(note_md)} characters")
+        logger.debug(f"Note content preview: {note_md[:100]}...")
     
-    try:
-        annot = first_page.add_text_annot((72, 72), note_md, icon="Comment")
-        logger.debug(f"Sticky note added with ID: {annot.info.get('id', 'unknown')}")
-    except Exception as e:
-        logger.error(f"Error adding sticky note: {str(e)}")
+        try:
+            annot = first_page.add_text_annot((72, 72), note_md, icon="Comment")
+            logger.debug(f"Sticky note added with ID: {annot.info.get('id', 'unknown')}")
+        except Exception as e:
+            logger.error(f"Error adding sticky note: {str(e)}")
     
-    highlight_count = 0
-    quote_match_records: List[Dict[str, Any]] = []
+        highlight_count = 0
+        quote_match_records: List[Dict[str, Any]] = []
+        # Quotes to locate, with their report entry and highlight color.
+        queries: List[QuoteQuery] = []
+        pending: List[Tuple[Dict[str, Any], List[float]]] = []
     
-    for category, category_quotes in quotes.items():
-        if category not in colors:
-            logger.warning(f"No color defined for category: {category}")
+        for category, category_quotes in quotes.items():
+            if category not in colors:
+                logger.warning(f"No color defined for category: {category}")
+                for i, raw_quote in enumerate(category_quotes):
+                    payload = _coerce_quote_payload(raw_quote)
+                    quote_match_records.append({
+                        "category": category,
+                        "quote_index": i + 1,
+                        "text": payload.text if payload else str(raw_quote),
+                        "matched": False,
+                        "page": None,
+                        "score": None,
+                        "method": None,
+                        "segments": 0,
+                        "matched_text": "",
+                        "skipped_reason": "no highlight color defined for category",
+                    })
+                continue
+        
+            rgb = colors[category]
+            logger.info(f"Processing {len(category_quotes)} quotes for {category} with color {rgb}")
+        
             for i, raw_quote in enumerate(category_quotes):
-                payload = _coerce_quote_payload(raw_quote)
-                quote_match_records.append({
+                report_entry: Dict[str, Any] = {
                     "category": category,
                     "quote_index": i + 1,
-                    "text": payload.text if payload else str(raw_quote),
+                    "text": "",
                     "matched": False,
                     "page": None,
                     "score": None,
                     "method": None,
                     "segments": 0,
                     "matched_text": "",
-                    "skipped_reason": "no highlight color defined for category",
-                })
-            continue
-        
-        rgb = colors[category]
-        logger.info(f"Processing {len(category_quotes)} quotes for {category} with color {rgb}")
-        
-        for i, raw_quote in enumerate(category_quotes):
-            report_entry: Dict[str, Any] = {
-                "category": category,
-                "quote_index": i + 1,
-                "text": "",
-                "matched": False,
-                "page": None,
-                "score": None,
-                "method": None,
-                "segments": 0,
-                "matched_text": "",
-                "skipped_reason": None,
-            }
-            payload = _coerce_quote_payload(raw_quote)
-            if not payload:
-                logger.warning(f"Unsupported quote payload in {category}, skipping: {raw_quote}")
-                report_entry["text"] = str(raw_quote)
-                report_entry["skipped_reason"] = "unsupported quote payload"
-                quote_match_records.append(report_entry)
-                continue
+                    "skipped_reason": None,
+                }
+                payload = _coerce_quote_payload(raw_quote)
+                if not payload:
+                    logger.warning(f"Unsupported quote payload in {category}, skipping: {raw_quote}")
+                    report_entry["text"] = str(raw_quote)
+                    report_entry["skipped_reason"] = "unsupported quote payload"
+                    quote_match_records.append(report_entry)
+                    continue
+
+                cleaned_quote = _strip_wrapping_quotes(payload.text)
+                report_entry["text"] = cleaned_quote
+                if not cleaned_quote:
+                    logger.warning(f"Quote contains only wrapping punctuation in {category}, skipping")
+                    report_entry["skipped_reason"] = "quote contains only wrapping punctuation"
+                    quote_match_records.append(report_entry)
+                    continue
 
-            cleaned_quote = _strip_wrapping_quotes(payload.text)
-            report_entry["text"] = cleaned_quote
-            if not cleaned_quote:
-                logger.warning(f"Quote contains only wrapping punctuation in {category}, skipping")
-                report_entry["skipped_reason"] = "quote contains only wrapping punctuation"
+                logger.debug(f"{category} quote {i+1}: '{cleaned_quote[:50]}...' ({len(cleaned_quote)} chars)")
+                if payload.pages:
+                    logger.debug(f"Page hints provided for quote: {payload.pages}")
+                # The entry keeps its place in the report; it is filled in once
+                # every quote has been located.
                 quote_match_records.append(report_entry)
-                continue
+                pending.append((report_entry, rgb))
+                queries.append(
+                    QuoteQuery(
+                        text=cleaned_quote,
+                        page_hints=payload.pages,
+                        prefix=payload.prefix,
+                        suffix=payload.suffix,
+                    )
+                )
 
-            logger.debug(f"{category} quote {i+1}: '{cleaned_quote[:50]}...' ({len(cleaned_quote)} chars)")
-            if payload.pages:
-                logger.debug(f"Page hints provided for quote: {payload.pages}")
-
-            match = locate_quote_in_document(
-                doc,
-                cleaned_quote,
-                page_hints=payload.pages,
-                min_similarity=min_similarity,
-                max_window_tokens=max_window_tokens,
-                prefix=payload.prefix,
-                suffix=payload.suffix,
-                word_cache=word_cache,
-            )
+        # Locate every quote in a single page-major pass over the document.
+        matches = locate_quotes_in_document(
+            doc,
+            queries,
+            min_similarity=min_similarity,
+            max_window_tokens=max_window_tokens,
+            max_exact_matches=max_exact_matches,
+            page_cache=page_cache,
+        )
+
+        for (report_entry, rgb), match in zip(pending, matches):
             if not match:
                 logger.warning(
                     "Quote not found above similarity threshold %.2f: '%s...'",
                     min_similarity,
-                    cleaned_quote[:50],
+                    report_entry["text"][:50],
                 )
                 report_entry["skipped_reason"] = (
                     f"not found above similarity threshold {min_similarity:.2f}"
                 )
-                quote_match_records.append(report_entry)
                 continue
 
             page = doc[match.page_index]
@@ -234,31 +346,28 @@ def annotate_pdf(
             except Exception as e:
                 logger.error(f"Error highlighting quote match: {str(e)}")
                 report_entry["skipped_reason"] = f"highlight failed: {e}"
-            quote_match_records.append(report_entry)
-    
-    logger.info(f"Added {highlight_count} highlights across all categories")
-    skipped_count = sum(1 for item in quote_match_records if not item["matched"])
-    match_report = {
-        "total": len(quote_match_records),
-        "matched": highlight_count,
-        "skipped": skipped_count,
-        "records": quote_match_records,
-    }
     
-    stem = path.stem
-    target_dir = output_dir if output_dir else path.parent
-    if output_dir:
-        target_dir.mkdir(parents=True, exist_ok=True)
-    output_path = target_dir / f"{stem}_annotated.pdf"
+        logger.info(f"Added {highlight_count} highlights across all categories")
+        skipped_count = sum(1 for item in quote_match_records if not item["matched"])
+        match_report = {
+            "total": len(quote_match_records),
+            "matched": highlight_count,
+            "skipped": skipped_count,
+            "records": quote_match_records,
+        }
+    except BaseException:
+        # Drop the temporary copy; any previous output stays as it was.
+        doc.close()
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+        raise
+
     logger.debug(f"Saving annotated PDF to: {output_path}")
-    
-    try:
-        doc.save(output_path, incremental=False, garbage=4)
-        logger.info("PDF saved successfully")
-    except Exception as e:
-        logger.error(f"Error saving PDF: {str(e)}")
-    
-    doc.close()
+    match_report["pdf_saved"] = _save_annotated_pdf(
+        doc, output_path, temp_path, save_garbage_level
+    )
+    if not match_report["pdf_saved"]:
+        logger.error(f"Annotated PDF was not written: {output_path}")
     return output_path, match_report
 
 def save_markdown(path: Path, content: str, output_dir: Optional[Path] = None) -> Path:
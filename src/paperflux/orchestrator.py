@@ -3,23 +3,67 @@ Orchestrator module for PaperFlux.
 Coordinates the entire pipeline from PDF extraction to annotation.
 """
 
+import asyncio
+import contextvars
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from .config import Config
 from .utils import finalize_output
 from .assistants import analyze_pdf
+from .providers import LLMProvider, get_provider
 
 ProgressCallback = Callable[[str], None]
 """Signature for stage-level progress notification callbacks."""
 
+TokenCallback = Callable[[str], None]
+"""Signature for callbacks that receive streamed summary text as it arrives."""
+
+# PyMuPDF is not thread-safe, so annotation runs in a worker thread (keeping the
+# event loop free for other PDFs' API calls) but only one PDF at a time.
+_ANNOTATION_LOCK = threading.Lock()
+
+# The PDF the current task is working on, used to route verbose log records to
+# that PDF's log file when several PDFs are processed concurrently.
+_current_pdf: contextvars.ContextVar[Optional[Path]] = contextvars.ContextVar(
+    "paperflux_current_pdf", default=None
+)
+
+
+class _PdfLogFilter(logging.Filter):
+    """Pass only records logged while processing one particular PDF."""
+
+    def __init__(self, pdf_path: Path) -> None:
+        super().__init__()
+        self._pdf_path = pdf_path
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return _current_pdf.get() == self._pdf_path
+
+
+def _finalize_output_locked(*args: Any, **kwargs: Any) -> Tuple[Path, Path, Path, Path]:
+    """Run :func:`finalize_output` while holding the PyMuPDF annotation lock."""
+    with _ANNOTATION_LOCK:
+        return finalize_output(*args, **kwargs)
+
+
+def _prefixed(callback: ProgressCallback, prefix: str) -> ProgressCallback:
+    """Return a progress callback that prepends *prefix* to every message."""
+    def emit(message: str) -> None:
+        callback(f"{prefix}{message}")
+    return emit
+
 
 async def run_pipeline(
     pdf_path: Path,
     cfg: Config,
     output_dir: Optional[Path] = None,
     progress_callback: Optional[ProgressCallback] = None,
+    token_callback: Optional[TokenCallback] = None,
+    provider: Optional[LLMProvider] = None,
 ) -> Tuple[Path, Path, Path, Path]:
     """Run the complete pipeline on a single PDF file.
 
@@ -33,15 +77,26 @@ async def run_pipeline(
             same directory as *pdf_path* when omitted.
         progress_callback: Optional callable invoked with a short status string
             at each major pipeline stage.
+        token_callback: Optional callable invoked with each chunk of summary
+            text as the provider streams it.
+        provider: Optional provider instance to reuse; a new one is created
+            from ``cfg.provider`` when omitted.
 
     Returns:
         A four-tuple of paths: the source PDF copy, the markdown notes file,
         the extracted quotes JSON, and the quote-match report JSON.
     """
-    result = await analyze_pdf(pdf_path, cfg, progress_callback=progress_callback)
+    result = await analyze_pdf(
+        pdf_path,
+        cfg,
+        progress_callback=progress_callback,
+        token_callback=token_callback,
+        provider=provider,
+    )
     md_note = result["key_takeaways"]
     quotes = result["quotes"]
-    return finalize_output(
+    return await asyncio.to_thread(
+        _finalize_output_locked,
         pdf_path,
         quotes,
         md_note,
@@ -58,12 +113,14 @@ async def batch_process(
     output_dir: Optional[Path] = None,
     show_progress: bool = True,
     progress_callback: Optional[ProgressCallback] = None,
+    token_callback: Optional[TokenCallback] = None,
+    max_concurrency: Optional[int] = None,
 ) -> List[Tuple[Path, Path, Path, Path]]:
     """
-    Process multiple PDF files in sequence.
+    Process multiple PDF files concurrently.
     
     Args:
-        pdf_paths: PDF files to process, handled one at a time in order.
+        pdf_paths: PDF files to process. Results are returned in this order.
         cfg: Application configuration, including the active LLM provider.
         verbose: Enables DEBUG-level logging and writes a per-PDF log file
             alongside each input file.
@@ -72,7 +129,13 @@ async def batch_process(
         show_progress: When False, suppresses all progress callback calls even
             if *progress_callback* is provided.
         progress_callback: Optional callable invoked with a short status string
-            at each major pipeline stage.
+            at each major pipeline stage. When PDFs run concurrently, stage
+            messages are prefixed with the PDF's file name.
+        token_callback: Optional callable invoked with each chunk of summary
+            text as it is streamed. Unaffected by *show_progress*. Streaming
+            processes PDFs one at a time so summaries do not interleave.
+        max_concurrency: Maximum number of PDFs in flight at once. Defaults to
+            the CPU count, capped at the number of PDFs.
 
     Returns:
         One four-tuple per input PDF: the source PDF copy, the markdown notes
@@ -81,31 +144,58 @@ async def batch_process(
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    results = []
     total = len(pdf_paths)
-    for index, pdf_path in enumerate(pdf_paths, start=1):
-        emit_progress = progress_callback if show_progress else None
-        if emit_progress:
-            emit_progress(f"[{index}/{total}] Processing {pdf_path.name}")
-        handler = None
-        if verbose:
-            log_file = pdf_path.with_suffix('.log')
-            handler = logging.FileHandler(log_file)
-            handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            logging.getLogger().addHandler(handler)
-        try:
-            pdf_out, md_out, quotes_out, match_report_out = await run_pipeline(
-                pdf_path,
-                cfg,
-                output_dir=output_dir,
-                progress_callback=emit_progress,
-            )
-            results.append((pdf_out, md_out, quotes_out, match_report_out))
-        finally:
-            if handler:
-                logging.getLogger().removeHandler(handler)
-                handler.close()
-    
-    return results
+    if token_callback is not None:
+        concurrency = 1
+    elif max_concurrency is not None:
+        concurrency = max(1, max_concurrency)
+    else:
+        concurrency = max(1, min(os.cpu_count() or 1, total))
+    semaphore = asyncio.Semaphore(concurrency)
+    # One provider instance for the whole batch so its API client (and the
+    # underlying connection pool) is reused across PDFs.
+    provider = get_provider(cfg.provider)
+
+    async def _process_one(index: int, pdf_path: Path) -> Tuple[Path, Path, Path, Path]:
+        async with semaphore:
+            _current_pdf.set(pdf_path)
+            emit_progress = progress_callback if show_progress else None
+            if emit_progress:
+                emit_progress(f"[{index}/{total}] Processing {pdf_path.name}")
+                if concurrency > 1:
+                    emit_progress = _prefixed(emit_progress, f"{pdf_path.name}: ")
+            handler = None
+            if verbose:
+                log_file = pdf_path.with_suffix('.log')
+                handler = logging.FileHandler(log_file)
+                handler.setLevel(logging.DEBUG)
+                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+                handler.setFormatter(formatter)
+                handler.addFilter(_PdfLogFilter(pdf_path))
+                logging.getLogger().addHandler(handler)
+            try:
+                return await run_pipeline(
+                    pdf_path,
+                    cfg,
+                    output_dir=output_dir,
+                    progress_callback=emit_progress,
+                    token_callback=token_callback,
+                    provider=provider,
+                )
+            finally:
+                if handler:
+                    logging.getLogger().removeHandler(handler)
+                    handler.close()
+
+    tasks = [
+        asyncio.ensure_future(_process_one(index, pdf_path))
+        for index, pdf_path in enumerate(pdf_paths, start=1)
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Stop the remaining PDFs on the first failure, as the sequential loop did.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
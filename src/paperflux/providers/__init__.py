@@ -7,7 +7,7 @@ imports another backend's SDK.
 
 import importlib
 
-from .base import LLMProvider, ProgressCallback
+from .base import LLMProvider, ProgressCallback, TokenCallback
 
 # provider name -> "module.path:ClassName"
 _PROVIDERS = {
@@ -35,4 +35,10 @@ def get_provider(name: str) -> LLMProvider:
     return provider_cls()
 
 
-__all__ = ["LLMProvider", "ProgressCallback", "get_provider", "available_providers"]
+__all__ = [
+    "LLMProvider",
+    "ProgressCallback",
+    "TokenCallback",
+    "get_provider",
+    "available_providers",
+]
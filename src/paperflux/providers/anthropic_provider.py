@@ -20,6 +20,7 @@ from anthropic import AsyncAnthropic
 from ..config import Config
 from .base import (
     ProgressCallback,
+    TokenCallback,
     dump_failed_response,
     load_template,
     load_text_file,
@@ -95,13 +96,29 @@ def _extract_text(message: Any) -> str:
 
 
 class AnthropicProvider:
-    """Analyze a PDF with Claude via the Messages API (native PDF in context)."""
+    """Analyze a PDF with Claude via the Messages API (native PDF in context).
+
+    The ``AsyncAnthropic`` client is created on first use and reused by later
+    calls on the same instance, so a batch run shares one connection pool.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[AsyncAnthropic] = None
+        self._client_api_key: Optional[str] = None
+
+    def _get_client(self, cfg: Config) -> AsyncAnthropic:
+        """Return the cached client, creating it if the API key changed."""
+        if self._client is None or self._client_api_key != cfg.anthropic.api_key:
+            self._client = AsyncAnthropic(api_key=cfg.anthropic.api_key)
+            self._client_api_key = cfg.anthropic.api_key
+        return self._client
 
     async def analyze_pdf(
         self,
         path: Path,
         cfg: Config,
         progress_callback: Optional[ProgressCallback] = None,
+        token_callback: Optional[TokenCallback] = None,
     ) -> dict:
         """Extract quotes and a summary from a PDF using the Anthropic Messages API.
 
@@ -116,6 +133,8 @@ class AnthropicProvider:
                 token limits, and extraction settings.
             progress_callback: Optional callable that receives a human-readable
                 status string at key stages of processing.
+            token_callback: Optional callable that receives summary text
+                deltas as they are streamed back.
 
         Returns:
             A dict with keys ``"key_takeaways"`` (str) and ``"quotes"`` (list).
@@ -124,7 +143,7 @@ class AnthropicProvider:
             ValueError: If a model response is truncated, refused, missing text
                 output, or contains malformed JSON.
         """
-        client = AsyncAnthropic(api_key=cfg.anthropic.api_key)
+        client = self._get_client(cfg)
 
         if progress_callback:
             progress_callback(f"Reading and encoding {path.name}")
@@ -233,6 +252,9 @@ class AnthropicProvider:
         if progress_callback:
             progress_callback("Generating summary")
         async with client.messages.stream(**summary_kwargs) as stream:
+            if token_callback:
+                async for text in stream.text_stream:
+                    token_callback(text)
             summary_message = await stream.get_final_message()
         _ensure_message_completed(summary_message, "Summary", cfg.ui.max_output_tokens)
         key_takeaways = _extract_text(summary_message)
@@ -7,9 +7,11 @@ bundle-normalisation routine) so each concrete provider only implements the
 parts that differ between SDKs.
 """
 
+import functools
+import re
 import time
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:  # pragma: no cover - typing-only convenience
     from typing import Protocol
@@ -21,6 +23,19 @@ from jinja2 import Environment, FileSystemLoader
 from ..config import Config
 
 ProgressCallback = Callable[[str], None]
+TokenCallback = Callable[[str], None]
+
+# Alternate key names accepted by normalize_category_bundle, in priority order.
+_NAME_KEYS = ("name", "category")
+_QUOTES_KEYS = ("quotes", "evidence", "quote_list")
+_SUMMARY_KEYS = ("category_summary", "summary")
+_TEXT_KEYS = ("text", "quote", "content")
+_PAGES_KEYS = ("pages", "page")
+_PREFIX_KEYS = ("prefix", "context_before")
+_SUFFIX_KEYS = ("suffix", "context_after")
+
+# Characters not allowed in dump_failed_response file names.
+_UNSAFE_LABEL_RE = re.compile(r"[^A-Za-z0-9_-]")
 
 
 class LLMProvider(Protocol):
@@ -35,6 +50,7 @@ class LLMProvider(Protocol):
         path: Path,
         cfg: Config,
         progress_callback: Optional[ProgressCallback] = None,
+        token_callback: Optional[TokenCallback] = None,
     ) -> dict:
         ...
 
@@ -50,21 +66,52 @@ def resolve_config_path(path: Union[str, Path], cfg: Config) -> Path:
     return candidate
 
 
+@functools.lru_cache(maxsize=None)
+def _template_environment(directory: str) -> Environment:
+    """Return the shared Jinja2 environment for templates under absolute *directory*."""
+    return Environment(
+        loader=FileSystemLoader(directory),
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
 def load_template(template_path: Union[str, Path]):
-    """Load a Jinja2 template given its filesystem path."""
-    template_path = Path(template_path)
-    env = Environment(loader=FileSystemLoader(str(template_path.parent or Path("."))))
+    """Load a Jinja2 template given its filesystem path.
+
+    Compiled templates are cached per absolute path for the life of the
+    process, so a batch run reads and compiles each prompt file once.
+    """
+    return _load_template(Path(template_path).resolve())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(template_path: Path):
+    env = _template_environment(str(template_path.parent))
     return env.get_template(template_path.name)
 
 
 def load_text_file(path: Union[str, Path]) -> str:
-    """Read a UTF-8 text file and return its contents with leading/trailing whitespace stripped."""
+    """Read a UTF-8 text file and return its contents with leading/trailing whitespace stripped.
+
+    Results are cached per absolute path for the life of the process.
+    """
+    return _load_text_file(Path(path).resolve())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_text_file(path: Path) -> str:
     with open(path, "r", encoding="utf-8") as handle:
         return handle.read().strip()
 
 
+@functools.lru_cache(maxsize=None)
 def multi_category_schema(max_quotes_per_category: int) -> dict:
-    """JSON schema for the bundled per-category quote extraction response."""
+    """JSON schema for the bundled per-category quote extraction response.
+
+    The schema is built once per ``max_quotes_per_category`` value and shared
+    between calls; callers that need to modify it must work on a copy.
+    """
     return {
         "type": "object",
         "additionalProperties": False,
@@ -104,6 +151,15 @@ def multi_category_schema(max_quotes_per_category: int) -> dict:
     }
 
 
+def _first(mapping: dict, keys: Tuple[str, ...]) -> Any:
+    """Return the first truthy value stored under one of *keys*, else ``None``."""
+    for key in keys:
+        value = mapping.get(key)
+        if value:
+            return value
+    return None
+
+
 def normalize_category_bundle(
     result: dict,
 ) -> Tuple[Dict[str, list], Dict[str, str]]:
@@ -113,39 +169,34 @@ def normalize_category_bundle(
     list pages, bare-string quotes) so both backends feed the same downstream
     quote-matching pipeline.
     """
+    quotes: Dict[str, list] = {}
+    category_summaries: Dict[str, str] = {}
     bundle_list = result.get("categories")
     if not isinstance(bundle_list, list):
         raise ValueError("Category bundle JSON missing 'categories' array")
 
-    quotes: Dict[str, list] = {}
-    category_summaries: Dict[str, str] = {}
     for entry in bundle_list:
         if not isinstance(entry, dict):
             continue
-        category = entry.get("name") or entry.get("category")
+        category = _first(entry, _NAME_KEYS)
         if not isinstance(category, str):
             continue
-        raw_quotes = (
-            entry.get("quotes")
-            or entry.get("evidence")
-            or entry.get("quote_list")
-            or []
-        )
+        raw_quotes = _first(entry, _QUOTES_KEYS) or []
         normalised_quotes: List[dict] = []
         for item in raw_quotes:
             if isinstance(item, dict):
-                text_val = item.get("text") or item.get("quote") or item.get("content")
+                text_val = _first(item, _TEXT_KEYS)
                 if not isinstance(text_val, str) or not text_val.strip():
                     continue
-                pages_val = item.get("pages") or item.get("page")
+                pages_val = _first(item, _PAGES_KEYS)
                 if isinstance(pages_val, int):
                     pages = [pages_val]
                 elif isinstance(pages_val, list):
                     pages = [p for p in pages_val if isinstance(p, int) and p > 0]
                 else:
                     pages = []
-                prefix_val = item.get("prefix") or item.get("context_before") or ""
-                suffix_val = item.get("suffix") or item.get("context_after") or ""
+                prefix_val = _first(item, _PREFIX_KEYS) or ""
+                suffix_val = _first(item, _SUFFIX_KEYS) or ""
                 normalised_quotes.append({
                     "text": text_val.strip(),
                     "pages": pages,
@@ -160,7 +211,7 @@ def normalize_category_bundle(
                     "suffix": "",
                 })
         quotes[category] = normalised_quotes
-        summary_val = entry.get("category_summary") or entry.get("summary") or ""
+        summary_val = _first(entry, _SUMMARY_KEYS) or ""
         category_summaries[category] = summary_val
 
     return quotes, category_summaries
@@ -171,10 +222,10 @@ def dump_failed_response(label: str, content: str) -> Optional[Path]:
     try:
         dump_dir = Path(".paperflux")
         dump_dir.mkdir(exist_ok=True)
-        timestamp = int(time.time())
-        safe_label = "".join(
-            c if c.isalnum() or c in ("-", "_") else "_" for c in label
-        )[:40]
+        # Nanosecond stamps keep names unique when concurrent requests fail
+        # within the same second.
+        timestamp = time.time_ns()
+        safe_label = _UNSAFE_LABEL_RE.sub("_", label)[:40]
         path = dump_dir / f"failed_response_{safe_label}_{timestamp}.txt"
         path.write_text(content, encoding="utf-8")
         return path
@@ -1,15 +1,18 @@
 """OpenAI backend: Responses API + server-side vector store / file_search RAG."""
 
+import asyncio
+import functools
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
-from openai import OpenAI, AsyncOpenAI
+from openai import AsyncOpenAI
 
 from ..config import Config
 from .base import (
     ProgressCallback,
+    TokenCallback,
     dump_failed_response,
     load_template,
     load_text_file,
@@ -20,6 +23,10 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for PDF uploads; large enough that multi-MB papers are sent in a
+# handful of reads rather than thousands of default-sized ones.
+_UPLOAD_BUFFER_SIZE = 1 << 20
+
 
 def _build_text_payload(format_payload: dict, verbosity: str) -> dict:
     """Build the ``text`` parameter dict for a Responses API call."""
@@ -31,6 +38,52 @@ def _reasoning_payload(effort: str) -> Dict[str, str]:
     return {"effort": effort}
 
 
+@functools.lru_cache(maxsize=4)
+def _request_templates(
+    model: str,
+    max_output_tokens: int,
+    verbosity: str,
+    reasoning_effort: str,
+    max_quotes_per_category: int,
+    include_search_results: bool,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Build the static parts of the category and summary request kwargs.
+
+    Everything except ``input`` (and ``tools`` for category requests) depends
+    only on these settings, so the dicts are built once and shared across
+    PDFs and categories. Callers copy them before adding per-call keys.
+    """
+    category_kwargs: Dict[str, Any] = {
+        "model": model,
+        "max_output_tokens": max_output_tokens,
+        "text": _build_text_payload(
+            {
+                "type": "json_schema",
+                "name": "multi_category_schema",
+                "schema": multi_category_schema(max_quotes_per_category),
+                "strict": True,
+            },
+            verbosity,
+        ),
+        # Let the model issue several file_search queries in one turn instead
+        # of forcing a single call.
+        "tool_choice": "auto",
+        "parallel_tool_calls": True,
+        "store": False,
+        "reasoning": _reasoning_payload(reasoning_effort),
+    }
+    if include_search_results:
+        category_kwargs["include"] = ["file_search_call.results"]
+    summary_kwargs: Dict[str, Any] = {
+        "model": model,
+        "max_output_tokens": max_output_tokens,
+        "text": _build_text_payload({"type": "text"}, verbosity),
+        "store": False,
+        "reasoning": _reasoning_payload(reasoning_effort),
+    }
+    return category_kwargs, summary_kwargs
+
+
 def _ensure_response_completed(resp: Any, context: str, max_output_tokens: int) -> None:
     """Raise a descriptive error if the Responses API indicates truncation."""
     status = getattr(resp, "status", None)
@@ -55,13 +108,14 @@ def _extract_response_text(resp) -> str:
         output = getattr(resp, "output", None)
         if output and isinstance(output, list):
             chunks = []
+            append = chunks.append
             for item in output:
-                if getattr(item, "type", None) == "message":
-                    for c in getattr(item, "content", []) or []:
-                        if getattr(c, "type", None) == "output_text":
-                            t = getattr(c, "text", "")
-                            if t:
-                                chunks.append(t)
+                if item.type != "message":
+                    continue
+                for c in item.content or ():
+                    # Only output_text parts carry .text (refusals do not).
+                    if c.type == "output_text" and c.text:
+                        append(c.text)
             if chunks:
                 return "".join(chunks)
     except (AttributeError, TypeError, ValueError):  # unknown SDK shapes
@@ -88,45 +142,91 @@ def _extract_parsed_json(resp: Any) -> Optional[dict]:
     return None
 
 
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """Run *aws* concurrently; on the first failure cancel and await the rest.
+
+    Plain ``asyncio.gather`` leaves the other awaitables running when one
+    raises, so the caller's cleanup (deleting the vector store) would race
+    requests still using it.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _upload_pdf(client: AsyncOpenAI, vector_store_id: str, path: Path) -> None:
+    """Upload *path* into the vector store and wait until it is indexed."""
+    with open(path, "rb", buffering=_UPLOAD_BUFFER_SIZE) as f:
+        await client.vector_stores.files.upload_and_poll(
+            vector_store_id=vector_store_id,
+            file=f,
+        )
+
+
 class OpenAIProvider:
     """Use the OpenAI Responses API with the built-in file_search tool.
 
     Retrieval happens server-side: a temporary vector store is created, the PDF
-    is uploaded and indexed, one bundled category-extraction response runs with
-    file_search enabled, then a markdown summary is synthesized.
+    is uploaded and indexed, one category-extraction response per category runs
+    concurrently with file_search enabled, then a markdown summary is
+    synthesized.
+
+    The ``AsyncOpenAI`` client is created on first use and reused by later
+    calls on the same instance, so a batch run shares one connection pool.
     """
 
+    def __init__(self) -> None:
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_api_key: Optional[str] = None
+
+    def _get_client(self, cfg: Config) -> AsyncOpenAI:
+        """Return the cached client, creating it if the API key changed."""
+        if self._client is None or self._client_api_key != cfg.openai.api_key:
+            self._client = AsyncOpenAI(api_key=cfg.openai.api_key)
+            self._client_api_key = cfg.openai.api_key
+        return self._client
+
     async def analyze_pdf(
         self,
         path: Path,
         cfg: Config,
         progress_callback: Optional[ProgressCallback] = None,
+        token_callback: Optional[TokenCallback] = None,
     ) -> dict:
         """Analyze a PDF and return extracted quotes and a summary.
 
-        Uploads the PDF to a temporary OpenAI vector store, runs a bundled
-        category-extraction call with file_search, then synthesizes a global
-        summary. The vector store is deleted in a ``finally`` block regardless
-        of outcome.
+        Uploads the PDF to a temporary OpenAI vector store, runs one
+        file_search extraction call per category (at most
+        ``cfg.openai.max_parallel`` in flight), then streams a global
+        summary. The vector store is deleted in a ``finally`` block
+        regardless of outcome.
 
         Args:
             path: Path to the PDF file to analyze.
             cfg: Loaded PaperFlux configuration.
             progress_callback: Optional callable invoked with a status string
                 at each major pipeline stage.
+            token_callback: Optional callable invoked with each summary text
+                delta as it arrives from the stream.
 
         Returns:
             A dict with keys ``"key_takeaways"`` (str) and ``"quotes"``
             (Dict[category_name, list]).
         """
-        client_sync = OpenAI(api_key=cfg.openai.api_key)
+        client_async = self._get_client(cfg)
         vector_store_id: Optional[str] = None
 
         try:
-            # 1) Create vector store and upload PDF
+            # 1) Create vector store, then upload the PDF while the prompt
+            #    files are read off the event loop thread.
             if progress_callback:
                 progress_callback("Creating temporary vector store")
-            vector_store = client_sync.vector_stores.create(
+            vector_store = await client_async.vector_stores.create(
                 name="PaperFlux Vector Store",
                 expires_after={
                     "anchor": "last_active_at",
@@ -136,32 +236,23 @@ class OpenAIProvider:
             vector_store_id = vector_store.id
             if progress_callback:
                 progress_callback(f"Uploading and indexing {path.name}")
-            with open(path, "rb") as f:
-                client_sync.vector_stores.files.upload_and_poll(
-                    vector_store_id=vector_store_id,
-                    file=f,
-                )
-
-            categories = cfg.extraction_categories.categories  # Dict[name, description]
-
-            # 2) Bundle categories into a single Responses job with file_search
-            client_async = AsyncOpenAI(api_key=cfg.openai.api_key)
-            category_template = load_template(
-                resolve_config_path(cfg.rag.category_prompt_file, cfg)
-            )
-            category_system_prompt = load_text_file(
-                resolve_config_path(cfg.rag.category_system_prompt_file, cfg)
+            _, category_template, category_system_prompt = await _gather_or_cancel(
+                _upload_pdf(client_async, vector_store_id, path),
+                asyncio.to_thread(
+                    load_template,
+                    resolve_config_path(cfg.rag.category_prompt_file, cfg),
+                ),
+                asyncio.to_thread(
+                    load_text_file,
+                    resolve_config_path(cfg.rag.category_system_prompt_file, cfg),
+                ),
             )
 
-            category_entries = [
-                {"name": cat, "description": desc}
-                for cat, desc in categories.items()
-            ]
-            user_msg = category_template.render(
-                categories=category_entries,
-                max_quotes_per_category=cfg.rag.max_quotes_per_category,
-            )
+            categories = cfg.extraction_categories.categories  # Dict[name, description]
 
+            # 2) One file_search Responses job per category, run concurrently.
+            #    Each job reuses the bundled template/schema with a single
+            #    category so custom prompts keep working unchanged.
             file_search_tool = {
                 "type": "file_search",
                 "vector_store_ids": [vector_store_id],
@@ -170,55 +261,63 @@ class OpenAIProvider:
                 file_search_tool["max_num_results"] = cfg.rag.max_num_results
             tools = [file_search_tool]
 
-            schema = multi_category_schema(cfg.rag.max_quotes_per_category)
-            text_payload = _build_text_payload(
-                {
-                    "type": "json_schema",
-                    "name": "multi_category_schema",
-                    "schema": schema,
-                    "strict": True,
-                },
+            category_kwargs_base, summary_kwargs_base = _request_templates(
+                cfg.openai.model,
+                cfg.ui.max_output_tokens,
                 cfg.ui.verbosity,
+                cfg.ui.reasoning_effort,
+                cfg.rag.max_quotes_per_category,
+                cfg.rag.include_search_results,
             )
-            reasoning_payload = _reasoning_payload(cfg.ui.reasoning_effort)
-            request_input = [
-                {"role": "system", "content": category_system_prompt},
-                {"role": "user", "content": user_msg},
-            ]
-            kwargs = {
-                "model": cfg.openai.model,
-                "input": request_input,
-                "max_output_tokens": cfg.ui.max_output_tokens,
-                "tools": tools,
-                "text": text_payload,
-                "tool_choice": {"type": "file_search"},
-                "store": False,
-            }
-            if cfg.rag.include_search_results:
-                kwargs["include"] = ["file_search_call.results"]
-            kwargs["reasoning"] = reasoning_payload
+            semaphore = asyncio.Semaphore(cfg.openai.max_parallel)
+
+            async def _one_category(name: str, description: str) -> Tuple[str, list, str]:
+                user_msg = category_template.render(
+                    categories=[{"name": name, "description": description}],
+                    max_quotes_per_category=cfg.rag.max_quotes_per_category,
+                )
+                request_input = [
+                    {"role": "system", "content": category_system_prompt},
+                    {"role": "user", "content": user_msg},
+                ]
+                kwargs = {**category_kwargs_base, "input": request_input, "tools": tools}
+                context = f"Category '{name}'"
+                async with semaphore:
+                    resp = await client_async.responses.create(**kwargs)
+                _ensure_response_completed(resp, context, cfg.ui.max_output_tokens)
+
+                result = _extract_parsed_json(resp)
+                if result is None:
+                    text_val = _extract_response_text(resp)
+                    if not text_val or not text_val.strip():
+                        dump_path = dump_failed_response(
+                            f"category_{name}_no_parsed_json",
+                            getattr(resp, "output_text", "") or str(resp),
+                        )
+                        hint = f" (raw saved to {dump_path})" if dump_path else ""
+                        raise ValueError(f"{context} response missing parsed JSON{hint}")
+                    result = json.loads(text_val)
+                if not isinstance(result, dict):
+                    raise ValueError(f"{context} returned non-dict JSON: {type(result)}")
+
+                bundle_quotes, bundle_summaries = normalize_category_bundle(result)
+                if name not in bundle_quotes and len(bundle_quotes) == 1:
+                    # The model renamed the single requested category; keep its
+                    # quotes under the configured name.
+                    (returned_name,) = bundle_quotes
+                    return name, bundle_quotes[returned_name], bundle_summaries[returned_name]
+                return name, bundle_quotes.get(name, []), bundle_summaries.get(name, "")
+
             if progress_callback:
                 progress_callback("Extracting quotes with OpenAI")
-            multi_resp = await client_async.responses.create(**kwargs)
-            _ensure_response_completed(
-                multi_resp, "Category bundle", cfg.ui.max_output_tokens
+            category_results = await _gather_or_cancel(
+                *(_one_category(name, desc) for name, desc in categories.items())
             )
-
-            result = _extract_parsed_json(multi_resp)
-            if result is None:
-                text_val = _extract_response_text(multi_resp)
-                if not text_val or not text_val.strip():
-                    dump_path = dump_failed_response(
-                        "category_bundle_no_parsed_json",
-                        getattr(multi_resp, "output_text", "") or str(multi_resp),
-                    )
-                    hint = f" (raw saved to {dump_path})" if dump_path else ""
-                    raise ValueError(f"Category bundle response missing parsed JSON{hint}")
-                result = json.loads(text_val)
-            if not isinstance(result, dict):
-                raise ValueError(f"Category bundle returned non-dict JSON: {type(result)}")
-
-            quotes, category_summaries = normalize_category_bundle(result)
+            quotes: Dict[str, list] = {}
+            category_summaries: Dict[str, str] = {}
+            for name, category_quotes, summary in category_results:
+                quotes[name] = category_quotes
+                category_summaries[name] = summary
 
             # 3) Synthesize global summary (no tools required)
             summary_template = load_template(
@@ -228,21 +327,25 @@ class OpenAIProvider:
                 detail_level=cfg.ui.detail_level,
                 category_summaries=category_summaries,
             )
-            summary_text_payload = _build_text_payload({"type": "text"}, cfg.ui.verbosity)
-            summary_reasoning = _reasoning_payload(cfg.ui.reasoning_effort)
-            summary_kwargs = {
-                "model": cfg.openai.model,
-                "input": summary_msg,
-                "max_output_tokens": cfg.ui.max_output_tokens,
-                "text": summary_text_payload,
-                "store": False,
-            }
-            summary_kwargs["reasoning"] = summary_reasoning
+            summary_kwargs = {**summary_kwargs_base, "input": summary_msg}
             if progress_callback:
                 progress_callback("Generating summary")
-            summary_resp = await client_async.responses.create(**summary_kwargs)
+            summary_chunks = []
+            summary_resp = None
+            async with client_async.responses.stream(**summary_kwargs) as stream:
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        summary_chunks.append(event.delta)
+                        if token_callback:
+                            token_callback(event.delta)
+                    elif event.type in ("response.incomplete", "response.failed"):
+                        # The stream never reports "completed" in these cases, so
+                        # keep the terminal response for the truncation check.
+                        summary_resp = event.response
+                if summary_resp is None:
+                    summary_resp = await stream.get_final_response()
             _ensure_response_completed(summary_resp, "Summary", cfg.ui.max_output_tokens)
-            key_takeaways = _extract_response_text(summary_resp)
+            key_takeaways = "".join(summary_chunks) or _extract_response_text(summary_resp)
 
             return {"key_takeaways": key_takeaways, "quotes": quotes}
         finally:
@@ -250,7 +353,9 @@ class OpenAIProvider:
                 try:
                     if progress_callback:
                         progress_callback("Cleaning up temporary vector store")
-                    client_sync.vector_stores.delete(vector_store_id=vector_store_id)
+                    await client_async.vector_stores.delete(
+                        vector_store_id=vector_store_id
+                    )
                 except Exception as exc:
                     logger.warning(
                         "Failed to delete vector store %s: %s", vector_store_id, exc
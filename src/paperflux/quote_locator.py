@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 import string
 import unicodedata
 
@@ -19,6 +19,21 @@ import fitz
 
 _TOKEN_PUNCT = string.punctuation + "“”‘’"
 _HYPHEN_CHARS = "-\u2010\u2011\u2012\u2013\u2014\u2015\u2212"
+# Characters dropped from tokens in one C-level pass; anything else that is not
+# alphanumeric is filtered afterwards only when it actually occurs.
+_TOKEN_DELETE = str.maketrans(
+    "", "", _TOKEN_PUNCT + _HYPHEN_CHARS + string.whitespace + "\u00a0"
+)
+# Every non-alphanumeric ASCII character. NFKC is the identity on ASCII text, so
+# deleting these is the whole normalisation for pure-ASCII tokens.
+_ASCII_DELETE = str.maketrans(
+    "", "", "".join(chr(code) for code in range(128) if not chr(code).isalnum())
+)
+
+# Default word-extraction flags minus ligature preservation: MuPDF then expands
+# ligatures such as "ﬁ" itself, so most words reach ``normalize_token`` as ASCII
+# and skip NFKC. Mediabox clipping and whitespace handling are unchanged.
+_WORDS_FLAGS = fitz.TEXTFLAGS_WORDS & ~fitz.TEXT_PRESERVE_LIGATURES
 
 
 @dataclass(frozen=True)
@@ -39,17 +54,54 @@ class _WordToken:
     line_key: Tuple[int, int]
 
 
+@dataclass(frozen=True)
+class PageTokens:
+    """Normalized tokens for one page, reusable across every quote searched on it."""
+
+    words: Sequence[Sequence[Any]]
+    tokens: List[_WordToken]
+    key: str
+    token_offsets: Dict[int, int]
+    # ``(x0, y0, x1, y1)`` per word, converted to floats once per page.
+    boxes: List[Tuple[float, float, float, float]]
+    # ``(block, line)`` per word, the key line rectangles are grouped by.
+    line_keys: List[Tuple[int, int]]
+    # ``tokens[i].text`` as a plain list for the matchers' inner loops.
+    texts: List[str]
+    # Distinct token texts, for ruling a page out before scanning it.
+    token_set: FrozenSet[str]
+
+
+def build_page_tokens(words: Sequence[Sequence[Any]]) -> PageTokens:
+    """Normalize a page's PyMuPDF words once for repeated quote lookups."""
+    tokens = _word_tokens(words)
+    key, token_offsets = _token_key_index(tokens)
+    boxes = [(float(w[0]), float(w[1]), float(w[2]), float(w[3])) for w in words]
+    line_keys = [(int(w[5]), int(w[6])) if len(w) >= 7 else (-1, -1) for w in words]
+    texts = [token.text for token in tokens]
+    return PageTokens(
+        words=words,
+        tokens=tokens,
+        key=key,
+        token_offsets=token_offsets,
+        boxes=boxes,
+        line_keys=line_keys,
+        texts=texts,
+        token_set=frozenset(texts),
+    )
+
+
 def normalize_token(text: str) -> str:
     """Normalize a word token for robust comparison."""
     if not text:
         return ""
-    text = unicodedata.normalize("NFKC", text)
-    text = text.replace("\u00a0", " ")
-    text = text.replace("ﬁ", "fi").replace("ﬂ", "fl")
-    text = text.strip(_TOKEN_PUNCT)
-    for hyphen in _HYPHEN_CHARS:
-        text = text.replace(hyphen, "")
-    return "".join(ch for ch in text.lower() if ch.isalnum())
+    if text.isascii():
+        return text.translate(_ASCII_DELETE).lower()
+    # NFKC also folds ligatures such as "ﬁ" into their ASCII letters.
+    text = unicodedata.normalize("NFKC", text).translate(_TOKEN_DELETE).lower()
+    if text.isalnum():
+        return text
+    return "".join(ch for ch in text if ch.isalnum())
 
 
 def _quote_tokens(text: str) -> List[str]:
@@ -78,73 +130,132 @@ def _joined(tokens: Iterable[str]) -> str:
     return "".join(tokens)
 
 
+def _token_key_index(page_tokens: Sequence[_WordToken]) -> Tuple[str, Dict[int, int]]:
+    """Join page token texts and map each token's start offset to its index.
+
+    The offset just past the last token maps to ``len(page_tokens)`` so a match
+    end can be checked the same way as a match start.
+    """
+    offsets: Dict[int, int] = {}
+    position = 0
+    for index, token in enumerate(page_tokens):
+        offsets[position] = index
+        position += len(token.text)
+    offsets[position] = len(page_tokens)
+    return _joined(token.text for token in page_tokens), offsets
+
+
+def _find_exact_span(
+    page_key: str,
+    token_offsets: Dict[int, int],
+    target_key: str,
+    window_limit: int,
+) -> Optional[Tuple[int, int]]:
+    """Return the first ``(start, end)`` token span whose joined text equals *target_key*.
+
+    Matches must begin and end on token boundaries and cover at most
+    *window_limit* tokens. Each quote gets its own ``str.find`` scan rather
+    than sharing one regex alternation per page: ``find`` is a C-level
+    substring search, and an alternation's non-overlapping matches could hide
+    one quote's occurrence behind another's.
+    """
+    position = page_key.find(target_key)
+    while position != -1:
+        start = token_offsets.get(position)
+        if start is not None:
+            end = token_offsets.get(position + len(target_key))
+            if end is not None and end - start <= window_limit:
+                return start, end
+        position = page_key.find(target_key, position + 1)
+    return None
+
+
 def _line_rects_for_words(
-    words: Sequence[Sequence[Any]],
+    page: PageTokens,
     word_indices: Sequence[int],
 ) -> List[fitz.Rect]:
-    grouped: Dict[Tuple[int, int], List[int]] = {}
-    ordered_keys: List[Tuple[int, int]] = []
+    boxes = page.boxes
+    line_keys = page.line_keys
+    # Running (x0, y0, x1, y1) bounds per PDF line, in first-seen order.
+    bounds: Dict[Tuple[int, int], List[float]] = {}
     for index in word_indices:
-        word = words[index]
-        key = (int(word[5]), int(word[6]))
-        if key not in grouped:
-            grouped[key] = []
-            ordered_keys.append(key)
-        grouped[key].append(index)
-
-    rects: List[fitz.Rect] = []
-    for key in ordered_keys:
-        indices = grouped[key]
-        rects.append(
-            fitz.Rect(
-                min(float(words[i][0]) for i in indices),
-                min(float(words[i][1]) for i in indices),
-                max(float(words[i][2]) for i in indices),
-                max(float(words[i][3]) for i in indices),
-            )
-        )
-    return rects
+        key = line_keys[index]
+        x0, y0, x1, y1 = boxes[index]
+        line_bounds = bounds.get(key)
+        if line_bounds is None:
+            bounds[key] = [x0, y0, x1, y1]
+            continue
+        if x0 < line_bounds[0]:
+            line_bounds[0] = x0
+        if y0 < line_bounds[1]:
+            line_bounds[1] = y0
+        if x1 > line_bounds[2]:
+            line_bounds[2] = x1
+        if y1 > line_bounds[3]:
+            line_bounds[3] = y1
+
+    return [fitz.Rect(*line_bounds) for line_bounds in bounds.values()]
 
 
 def _matched_text(words: Sequence[Sequence[Any]], word_indices: Sequence[int]) -> str:
     return " ".join(str(words[index][4]) for index in word_indices).strip()
 
 
+@dataclass(frozen=True)
+class _PreparedQuote:
+    """A quote's normalized tokens and joined keys, computed once per quote."""
+
+    target_tokens: List[str]
+    target_key: str
+    prefix_tokens: List[str]
+    suffix_tokens: List[str]
+    context_key: str
+
+
+def _prepare_quote(quote_text: str, prefix: str = "", suffix: str = "") -> _PreparedQuote:
+    target_tokens = _quote_tokens(quote_text)
+    prefix_tokens = _quote_tokens(prefix)
+    suffix_tokens = _quote_tokens(suffix)
+    return _PreparedQuote(
+        target_tokens=target_tokens,
+        target_key=_joined(target_tokens),
+        prefix_tokens=prefix_tokens,
+        suffix_tokens=suffix_tokens,
+        context_key=_joined([*prefix_tokens, *target_tokens, *suffix_tokens]),
+    )
+
+
 def _score_context(
     base_score: float,
-    page_tokens: Sequence[_WordToken],
+    page_texts: Sequence[str],
     start: int,
     end: int,
-    target_tokens: Sequence[str],
-    prefix_tokens: Sequence[str],
-    suffix_tokens: Sequence[str],
+    quote: _PreparedQuote,
 ) -> float:
+    prefix_tokens = quote.prefix_tokens
+    suffix_tokens = quote.suffix_tokens
     if not prefix_tokens and not suffix_tokens:
         return base_score
 
     context_start = max(0, start - len(prefix_tokens) - 4)
-    context_end = min(len(page_tokens), end + len(suffix_tokens) + 4)
-    target_context = _joined([*prefix_tokens, *target_tokens, *suffix_tokens])
-    page_context = _joined(token.text for token in page_tokens[context_start:context_end])
-    if not target_context or not page_context:
+    context_end = min(len(page_texts), end + len(suffix_tokens) + 4)
+    page_context = _joined(page_texts[context_start:context_end])
+    if not quote.context_key or not page_context:
         return base_score
 
-    context_score = SequenceMatcher(None, target_context, page_context).ratio()
+    context_score = SequenceMatcher(None, quote.context_key, page_context).ratio()
     return (base_score * 0.75) + (context_score * 0.25)
 
 
 def _contiguous_target_run(
-    page_tokens: Sequence[_WordToken],
+    page_texts: Sequence[str],
     page_start: int,
     target_tokens: Sequence[str],
     target_start: int,
 ) -> int:
+    limit = min(len(page_texts) - page_start, len(target_tokens) - target_start)
     run = 0
-    while (
-        page_start + run < len(page_tokens)
-        and target_start + run < len(target_tokens)
-        and page_tokens[page_start + run].text == target_tokens[target_start + run]
-    ):
+    while run < limit and page_texts[page_start + run] == target_tokens[target_start + run]:
         run += 1
     return run
 
@@ -162,8 +273,7 @@ def _is_layout_gap(
 
 
 def _locate_layout_gap_match(
-    words: Sequence[Sequence[Any]],
-    page_tokens: Sequence[_WordToken],
+    page: PageTokens,
     target_tokens: Sequence[str],
     *,
     page_index: int,
@@ -176,8 +286,13 @@ def _locate_layout_gap_match(
     This accepts exact target-token runs separated by gaps only when the gap
     crosses a PDF line/block boundary. Skipped layout words are not highlighted.
     """
+    page_tokens = page.tokens
+    page_texts = page.texts
     if len(target_tokens) < 8:
         return None
+    # Every target token must be matched somewhere on the page.
+    if not page.token_set.issuperset(target_tokens):
+        return None
 
     min_initial_run = min(3, len(target_tokens))
     max_gaps = 3
@@ -186,11 +301,12 @@ def _locate_layout_gap_match(
     best_span: List[int] = []
     best_gap_count = 0
 
-    for start in range(len(page_tokens)):
-        if page_tokens[start].text != target_tokens[0]:
+    first_target = target_tokens[0]
+    for start, start_text in enumerate(page_texts):
+        if start_text != first_target:
             continue
 
-        initial_run = _contiguous_target_run(page_tokens, start, target_tokens, 0)
+        initial_run = _contiguous_target_run(page_texts, start, target_tokens, 0)
         if initial_run < min_initial_run:
             continue
 
@@ -204,12 +320,13 @@ def _locate_layout_gap_match(
         while target_index < len(target_tokens):
             best_candidate_index: Optional[int] = None
             best_candidate_run = 0
+            wanted = target_tokens[target_index]
 
             for candidate_index in range(current_page_index + 1, search_limit):
-                if page_tokens[candidate_index].text != target_tokens[target_index]:
+                if page_texts[candidate_index] != wanted:
                     continue
                 run = _contiguous_target_run(
-                    page_tokens,
+                    page_texts,
                     candidate_index,
                     target_tokens,
                     target_index,
@@ -257,8 +374,8 @@ def _locate_layout_gap_match(
         page_index=page_index,
         score=best_score,
         method="layout-gap",
-        areas=_line_rects_for_words(words, best_span),
-        matched_text=_matched_text(words, best_span),
+        areas=_line_rects_for_words(page, best_span),
+        matched_text=_matched_text(page.words, best_span),
     )
 
 
@@ -279,46 +396,51 @@ def locate_quote_in_words(
     search finds the closest local word span and accepts it only above
     ``min_similarity``.
     """
-    page_tokens = _word_tokens(words)
-    target_tokens = _quote_tokens(quote_text)
+    return _locate_quote_in_page(
+        build_page_tokens(words),
+        _prepare_quote(quote_text, prefix, suffix),
+        page_index=page_index,
+        min_similarity=min_similarity,
+        max_window_tokens=max_window_tokens,
+    )
+
+
+def _locate_quote_in_page(
+    page: PageTokens,
+    quote: _PreparedQuote,
+    *,
+    page_index: int,
+    min_similarity: float,
+    max_window_tokens: int,
+) -> Optional[QuoteMatch]:
+    """Locate one prepared quote on a pre-tokenized page; see :func:`locate_quote_in_words`."""
+    words = page.words
+    page_tokens = page.tokens
+    page_texts = page.texts
+    target_tokens = quote.target_tokens
     if not page_tokens or not target_tokens:
         return None
 
-    target_key = _joined(target_tokens)
+    target_key = quote.target_key
     if not target_key:
         return None
 
     window_limit = max(max_window_tokens, len(target_tokens) + 12)
-    prefix_tokens = _quote_tokens(prefix)
-    suffix_tokens = _quote_tokens(suffix)
 
     # Exact normalized span. Joining tokens lets hyphenation and punctuation
     # differ while still requiring the same underlying characters.
-    for start in range(len(page_tokens)):
-        candidate_key = ""
-        matched_word_indices: List[int] = []
-        for end in range(start, min(len(page_tokens), start + window_limit)):
-            candidate_key += page_tokens[end].text
-            matched_word_indices.append(page_tokens[end].word_index)
-            if not target_key.startswith(candidate_key):
-                break
-            if candidate_key == target_key:
-                score = _score_context(
-                    1.0,
-                    page_tokens,
-                    start,
-                    end + 1,
-                    target_tokens,
-                    prefix_tokens,
-                    suffix_tokens,
-                )
-                return QuoteMatch(
-                    page_index=page_index,
-                    score=score,
-                    method="exact",
-                    areas=_line_rects_for_words(words, matched_word_indices),
-                    matched_text=_matched_text(words, matched_word_indices),
-                )
+    exact_span = _find_exact_span(page.key, page.token_offsets, target_key, window_limit)
+    if exact_span is not None:
+        start, end = exact_span
+        matched_word_indices = [page_tokens[index].word_index for index in range(start, end)]
+        score = _score_context(1.0, page_texts, start, end, quote)
+        return QuoteMatch(
+            page_index=page_index,
+            score=score,
+            method="exact",
+            areas=_line_rects_for_words(page, matched_word_indices),
+            matched_text=_matched_text(words, matched_word_indices),
+        )
 
     target_len = len(target_key)
     min_chars = max(8, int(target_len * 0.55))
@@ -327,51 +449,73 @@ def locate_quote_in_words(
     min_overlap = 0.45 if len(target_set) >= 6 else 0.35
     min_quick_score = max(0.55, min_similarity - 0.12)
 
+    # Per-character counts of the target, so SequenceMatcher.quick_ratio can
+    # be evaluated incrementally without building a matcher per window.
+    target_counts: Dict[str, int] = {}
+    for ch in target_key:
+        target_counts[ch] = target_counts.get(ch, 0) + 1
+    target_unique = max(1, len(target_set))
+    page_key = page.key
+    token_count = len(page_texts)
+    has_context = bool(quote.prefix_tokens or quote.suffix_tokens)
+
     best_score = 0.0
     best_span: List[int] = []
 
-    for start in range(len(page_tokens)):
-        candidate_key = ""
-        candidate_tokens: List[str] = []
-        matched_word_indices = []
-        for end in range(start, min(len(page_tokens), start + window_limit)):
-            token = page_tokens[end]
-            candidate_key += token.text
-            candidate_tokens.append(token.text)
-            matched_word_indices.append(token.word_index)
-
-            candidate_len = len(candidate_key)
+    # A window's token overlap can never exceed the whole page's, so pages
+    # sharing too few tokens with the quote are ruled out without a scan.
+    page_overlap = len(target_set.intersection(page.token_set)) / target_unique
+    scan_count = token_count if page_overlap >= min_overlap else 0
+
+    start_offset = 0
+    for start in range(scan_count):
+        if start:
+            start_offset += len(page_texts[start - 1])
+        candidate_len = 0
+        seen_targets = set()
+        candidate_counts: Dict[str, int] = {}
+        common_chars = 0
+        for end in range(start, min(token_count, start + window_limit)):
+            token_text = page_texts[end]
+            candidate_len += len(token_text)
             if candidate_len > max_chars:
                 break
+            if token_text in target_set:
+                seen_targets.add(token_text)
+            for ch in token_text:
+                count = candidate_counts.get(ch, 0) + 1
+                candidate_counts[ch] = count
+                if count <= target_counts.get(ch, 0):
+                    common_chars += 1
             if candidate_len < min_chars:
                 continue
 
-            overlap = len(target_set.intersection(candidate_tokens)) / max(1, len(target_set))
+            overlap = len(seen_targets) / target_unique
             if overlap < min_overlap:
                 continue
 
-            matcher = SequenceMatcher(None, target_key, candidate_key)
-            if matcher.quick_ratio() < min_quick_score:
+            # Same value as SequenceMatcher.quick_ratio() for this window.
+            quick_score = 2.0 * common_chars / (target_len + candidate_len)
+            if quick_score < min_quick_score:
+                continue
+            # quick_ratio() bounds ratio() from above, so skip windows that
+            # could not beat the current best even with a perfect ratio.
+            score_bound = (quick_score * 0.82) + (overlap * 0.18)
+            if has_context:
+                score_bound = (score_bound * 0.75) + (1.0 * 0.25)
+            if score_bound <= best_score:
                 continue
-            char_score = matcher.ratio()
+            candidate_key = page_key[start_offset:start_offset + candidate_len]
+            char_score = SequenceMatcher(None, target_key, candidate_key).ratio()
             score = (char_score * 0.82) + (overlap * 0.18)
-            score = _score_context(
-                score,
-                page_tokens,
-                start,
-                end + 1,
-                target_tokens,
-                prefix_tokens,
-                suffix_tokens,
-            )
+            score = _score_context(score, page_texts, start, end + 1, quote)
             if score > best_score:
                 best_score = score
-                best_span = matched_word_indices.copy()
+                best_span = [token.word_index for token in page_tokens[start:end + 1]]
 
     if best_score < min_similarity or not best_span:
         layout_gap_match = _locate_layout_gap_match(
-            words,
-            page_tokens,
+            page,
             target_tokens,
             page_index=page_index,
             min_similarity=min_similarity,
@@ -385,54 +529,189 @@ def locate_quote_in_words(
         page_index=page_index,
         score=best_score,
         method="fuzzy",
-        areas=_line_rects_for_words(words, best_span),
+        areas=_line_rects_for_words(page, best_span),
         matched_text=_matched_text(words, best_span),
     )
 
 
-def locate_quote_in_document(
-    doc: fitz.Document,
-    quote_text: str,
-    *,
-    page_hints: Optional[Sequence[int]] = None,
-    min_similarity: float = 0.88,
-    max_window_tokens: int = 80,
-    prefix: str = "",
-    suffix: str = "",
-    word_cache: Optional[Dict[int, Sequence[Sequence[Any]]]] = None,
-) -> Optional[QuoteMatch]:
-    """Locate the best quote match across a document."""
+@dataclass(frozen=True)
+class QuoteQuery:
+    """One quote to locate, with optional 1-indexed page hints and context."""
+
+    text: str
+    page_hints: Sequence[int] = ()
+    prefix: str = ""
+    suffix: str = ""
+
+
+def _valid_page_hints(page_hints: Sequence[int], page_count: int) -> List[int]:
+    """Convert 1-indexed hints to unique, in-range 0-indexed pages, keeping order."""
     valid_hints: List[int] = []
     for page_number in page_hints or []:
         page_index = page_number - 1
-        if 0 <= page_index < len(doc) and page_index not in valid_hints:
+        if 0 <= page_index < page_count and page_index not in valid_hints:
             valid_hints.append(page_index)
+    return valid_hints
 
-    ordered_pages = valid_hints + [idx for idx in range(len(doc)) if idx not in valid_hints]
-    best: Optional[QuoteMatch] = None
 
-    for page_index in ordered_pages:
+def _cached_page(
+    doc: fitz.Document,
+    page_index: int,
+    word_cache: Optional[Dict[int, Sequence[Sequence[Any]]]],
+    page_cache: Dict[int, PageTokens],
+) -> PageTokens:
+    """Return the tokenized page, extracting and normalizing it on first use."""
+    page = page_cache.get(page_index)
+    if page is None:
         if word_cache is not None and page_index in word_cache:
             words = word_cache[page_index]
         else:
-            words = doc[page_index].get_text("words")
+            words = doc[page_index].get_text("words", flags=_WORDS_FLAGS)
             if word_cache is not None:
                 word_cache[page_index] = words
+        page = build_page_tokens(words)
+        page_cache[page_index] = page
+    return page
 
-        match = locate_quote_in_words(
-            words,
-            quote_text,
+
+@dataclass
+class _QuoteSearch:
+    """Running state for one query during a document pass."""
+
+    query: QuoteQuery
+    prepared: _PreparedQuote
+    page_hints: List[int]
+    best: Optional[QuoteMatch] = None
+    exact_matches: int = 0
+    finished: bool = False
+
+    def search(
+        self,
+        page: PageTokens,
+        page_index: int,
+        *,
+        min_similarity: float,
+        max_window_tokens: int,
+        max_exact_matches: Optional[int],
+    ) -> None:
+        """Search one page and keep the match if it beats the current best."""
+        match = _locate_quote_in_page(
+            page,
+            self.prepared,
             page_index=page_index,
             min_similarity=min_similarity,
             max_window_tokens=max_window_tokens,
-            prefix=prefix,
-            suffix=suffix,
         )
-        if not match:
-            continue
-        if best is None or match.score > best.score:
-            best = match
-            if match.score >= 1.0 and not prefix and not suffix:
+        if match is None:
+            return
+        if self.best is None or match.score > self.best.score:
+            self.best = match
+            query = self.query
+            self.finished = match.score >= 1.0 and not query.prefix and not query.suffix
+        if match.method == "exact":
+            self.exact_matches += 1
+            if max_exact_matches is not None and self.exact_matches >= max_exact_matches:
+                self.finished = True
+
+
+def locate_quotes_in_document(
+    doc: fitz.Document,
+    queries: Sequence[QuoteQuery],
+    *,
+    min_similarity: float = 0.88,
+    max_window_tokens: int = 80,
+    max_exact_matches: Optional[int] = None,
+    word_cache: Optional[Dict[int, Sequence[Sequence[Any]]]] = None,
+    page_cache: Optional[Dict[int, PageTokens]] = None,
+) -> List[Optional[QuoteMatch]]:
+    """Locate the best match for every query in one pass over the document.
+
+    Each query's hinted pages are searched first, then the remaining pages are
+    visited in order with all still-unresolved queries checked against each
+    page while it is loaded. A query stops early on a perfect match without
+    prefix/suffix context, exactly as :func:`locate_quote_in_document` does,
+    or once *max_exact_matches* exact matches have been seen; the best of the
+    pages searched so far is returned.
+    """
+    if page_cache is None:
+        page_cache = {}
+    # Identical queries (e.g. one quote listed under two categories) are
+    # searched once and share the result.
+    unique_index: Dict[Tuple[str, Tuple[int, ...], str, str], int] = {}
+    owners: List[int] = []
+    searches: List[_QuoteSearch] = []
+    for query in queries:
+        query_key = (query.text, tuple(query.page_hints), query.prefix, query.suffix)
+        if query_key not in unique_index:
+            unique_index[query_key] = len(searches)
+            searches.append(
+                _QuoteSearch(
+                    query=query,
+                    # Normalize each quote once rather than once per page searched.
+                    prepared=_prepare_quote(query.text, query.prefix, query.suffix),
+                    page_hints=_valid_page_hints(query.page_hints, len(doc)),
+                )
+            )
+        owners.append(unique_index[query_key])
+
+    for search in searches:
+        for page_index in search.page_hints:
+            page = _cached_page(doc, page_index, word_cache, page_cache)
+            search.search(
+                page,
+                page_index,
+                min_similarity=min_similarity,
+                max_window_tokens=max_window_tokens,
+                max_exact_matches=max_exact_matches,
+            )
+            if search.finished:
                 break
 
-    return best
+    for page_index in range(len(doc)):
+        pending = [
+            search
+            for search in searches
+            if not search.finished and page_index not in search.page_hints
+        ]
+        if not pending:
+            continue
+        page = _cached_page(doc, page_index, word_cache, page_cache)
+        for search in pending:
+            search.search(
+                page,
+                page_index,
+                min_similarity=min_similarity,
+                max_window_tokens=max_window_tokens,
+                max_exact_matches=max_exact_matches,
+            )
+
+    return [searches[owner].best for owner in owners]
+
+
+def locate_quote_in_document(
+    doc: fitz.Document,
+    quote_text: str,
+    *,
+    page_hints: Optional[Sequence[int]] = None,
+    min_similarity: float = 0.88,
+    max_window_tokens: int = 80,
+    prefix: str = "",
+    suffix: str = "",
+    word_cache: Optional[Dict[int, Sequence[Sequence[Any]]]] = None,
+    page_cache: Optional[Dict[int, PageTokens]] = None,
+) -> Optional[QuoteMatch]:
+    """Locate the best quote match across a document.
+
+    Pass the same *page_cache* for every quote in a document so each page's
+    words are extracted and normalized only once. *word_cache* holds raw
+    PyMuPDF words and is consulted when a page is not yet in *page_cache*.
+    """
+    query = QuoteQuery(text=quote_text, page_hints=page_hints or (), prefix=prefix, suffix=suffix)
+    return locate_quotes_in_document(
+        doc,
+        [query],
+        min_similarity=min_similarity,
+        max_window_tokens=max_window_tokens,
+        word_cache=word_cache,
+        page_cache=page_cache,
+    )[0]
@@ -5,7 +5,12 @@ Handles PDF annotation and markdown generation.
 
 import json
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .config import Config
 from .io_pdf import annotate_pdf, save_markdown
@@ -13,6 +18,20 @@ from .io_pdf import annotate_pdf, save_markdown
 ProgressCallback = Callable[[str], None]
 
 
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialise *obj* as 2-space indented UTF-8 JSON, using ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def finalize_output(
     pdf_path: Path, 
     quotes: Dict[str, List[Any]], 
@@ -55,7 +74,7 @@ def finalize_output(
     if not quote_counts_lines:
         quote_counts_lines = "- No quotes collected"
 
-    full_md = (
+    md_parts: List[str] = [
         f"# Summary for {pdf_path.stem}\n\n"
         "## Key takeaways\n\n"
         f"{md_note.strip()}\n\n"
@@ -67,7 +86,7 @@ def finalize_output(
         f"- Skipped: {match_report['skipped']} quote"
         f"{'s' if match_report['skipped'] != 1 else ''}\n\n"
         "## Exact quotations by category\n"
-    )
+    ]
     def _format_quote_entry(entry: Any) -> str:
         if isinstance(entry, dict):
             text_val = entry.get("text")
@@ -90,16 +109,16 @@ def finalize_output(
         return f"- {entry}"
 
     for category, items in quotes.items():
-        full_md += f"\n### {category.capitalize()}\n"
+        md_parts.append(f"\n### {category.capitalize()}\n")
         for q in items:
-            full_md += _format_quote_entry(q) + "\n"
+            md_parts.append(_format_quote_entry(q) + "\n")
 
     skipped_entries = [entry for entry in match_report["records"] if not entry["matched"]]
     if skipped_entries:
-        full_md += "\n## Skipped quotes\n"
+        md_parts.append("\n## Skipped quotes\n")
         for entry in skipped_entries:
             reason = entry.get("skipped_reason") or "not matched"
-            full_md += (
+            md_parts.append(
                 f"- {entry['category']} #{entry['quote_index']} ({reason}): "
                 f"{entry['text']}\n"
             )
@@ -108,7 +127,7 @@ def finalize_output(
         progress_callback("Writing markdown, quotes, and match report")
 
     # Save markdown
-    md_out = save_markdown(pdf_path, full_md, output_dir=output_dir)
+    md_out = save_markdown(pdf_path, "".join(md_parts), output_dir=output_dir)
 
     # Save quotes payload for reuse
     quotes_payload = {
@@ -117,9 +136,9 @@ def finalize_output(
     }
     target_dir = output_dir if output_dir else pdf_path.parent
     quotes_path = target_dir / f"{pdf_path.stem}_quotes.json"
-    quotes_path.write_text(json.dumps(quotes_payload, indent=2), encoding="utf-8")
+    quotes_path.write_bytes(json_dumps(quotes_payload))
 
     match_report_path = target_dir / f"{pdf_path.stem}_quote_matches.json"
-    match_report_path.write_text(json.dumps(match_report, indent=2), encoding="utf-8")
+    match_report_path.write_bytes(json_dumps(match_report))
     
     return pdf_out, md_out, quotes_path, match_report_path
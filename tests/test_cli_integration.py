@@ -1,7 +1,9 @@
+import inspect
 import json
 from types import SimpleNamespace
 
 import fitz
+import pytest
 from typer.testing import CliRunner
 
 from paperflux import cli
@@ -118,6 +120,111 @@ rag:
     )
     return config_path
 
+class _FakeResponseStream:
+    def __init__(self, deltas, terminal_event=None):
+        self._deltas = deltas
+        self._terminal_event = terminal_event
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def __aiter__(self):
+        for delta in self._deltas:
+            yield SimpleNamespace(type="response.output_text.delta", delta=delta)
+        if self._terminal_event is not None:
+            yield self._terminal_event
+
+    async def get_final_response(self):
+        if self._terminal_event is not None:
+            # The SDK raises here when the stream never reported "completed".
+            raise RuntimeError("Didn't receive a `response.completed` event.")
+        return SimpleNamespace(status="completed", output_text="".join(self._deltas))
+
+
+def _write_two_category_config(root):
+    """Write the test config with a second ``limitations`` category."""
+    config_path = _write_config(root)
+    config_text = config_path.read_text(encoding="utf-8")
+    config_text = config_text.replace(
+        '    contributions: "Important contributions."\n',
+        '    contributions: "Important contributions."\n'
+        '    limitations: "Known limitations."\n',
+    ).replace(
+        "    contributions: [1.0, 1.0, 0.0]\n",
+        "    contributions: [1.0, 1.0, 0.0]\n    limitations: [1.0, 0.6, 0.0]\n",
+    )
+    config_path.write_text(config_text, encoding="utf-8")
+    return config_path
+
+
+def _install_fake_openai(
+    monkeypatch,
+    responses_create,
+    summary_deltas=("Summary.",),
+    upload=None,
+    summary_terminal_event=None,
+):
+    """Replace ``AsyncOpenAI`` with an in-memory fake and return its call log.
+
+    *responses_create* receives the kwargs of each ``responses.create`` call and
+    returns the fake response, or an awaitable resolving to it;
+    ``responses.stream`` yields *summary_deltas*, then *summary_terminal_event*
+    if given. An optional *upload* coroutine function is awaited inside each
+    ``upload_and_poll`` call.
+    """
+    calls = SimpleNamespace(
+        clients=[],
+        created_vector_stores=[],
+        uploaded_vector_stores=[],
+        deleted_vector_stores=[],
+        response_requests=[],
+    )
+
+    class FakeFiles:
+        async def upload_and_poll(self, *, vector_store_id, file):
+            calls.uploaded_vector_stores.append(vector_store_id)
+            file.read(1)
+            if upload is not None:
+                await upload()
+            return SimpleNamespace(id="vs_file_test")
+
+    class FakeVectorStores:
+        def __init__(self):
+            self.files = FakeFiles()
+
+        async def create(self, **kwargs):
+            calls.created_vector_stores.append(kwargs)
+            return SimpleNamespace(id="vs_test")
+
+        async def delete(self, *, vector_store_id):
+            calls.deleted_vector_stores.append(vector_store_id)
+            return SimpleNamespace(id=vector_store_id, deleted=True)
+
+    class FakeResponses:
+        async def create(self, **kwargs):
+            calls.response_requests.append(kwargs)
+            response = responses_create(kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+        def stream(self, **kwargs):
+            calls.response_requests.append(kwargs)
+            return _FakeResponseStream(list(summary_deltas), summary_terminal_event)
+
+    class FakeAsyncOpenAI:
+        def __init__(self, *, api_key):
+            calls.clients.append(api_key)
+            self.responses = FakeResponses()
+            self.vector_stores = FakeVectorStores()
+
+    monkeypatch.setattr("paperflux.providers.openai_provider.AsyncOpenAI", FakeAsyncOpenAI)
+    return calls
+
+
 
 def test_cli_full_pipeline_with_mocked_anthropic_and_tiny_pdf(tmp_path, monkeypatch):
     app_root = tmp_path / "app"
@@ -233,67 +340,30 @@ def test_cli_full_pipeline_with_mocked_openai_and_tiny_pdf(tmp_path, monkeypatch
     outside_cwd.mkdir()
     _write_tiny_pdf(pdf_path)
 
-    created_vector_stores = []
-    deleted_vector_stores = []
-    uploaded_vector_stores = []
-    response_requests = []
-
-    class FakeFiles:
-        def upload_and_poll(self, *, vector_store_id, file):
-            uploaded_vector_stores.append(vector_store_id)
-            file.read(1)
-            return SimpleNamespace(id="vs_file_test")
-
-    class FakeVectorStores:
-        def __init__(self):
-            self.files = FakeFiles()
-
-        def create(self, **kwargs):
-            created_vector_stores.append(kwargs)
-            return SimpleNamespace(id="vs_test")
-
-        def delete(self, *, vector_store_id):
-            deleted_vector_stores.append(vector_store_id)
-            return SimpleNamespace(id=vector_store_id, deleted=True)
-
-    class FakeOpenAI:
-        def __init__(self, *, api_key):
-            self.api_key = api_key
-            self.vector_stores = FakeVectorStores()
-
-    class FakeResponses:
-        async def create(self, **kwargs):
-            response_requests.append(kwargs)
-            if kwargs.get("tools"):
-                payload = {
-                    "categories": [
+    def responses_create(kwargs):
+        payload = {
+            "categories": [
+                {
+                    "name": "contributions",
+                    "quotes": [
                         {
-                            "name": "contributions",
-                            "quotes": [
-                                {
-                                    "text": "This paper introduces a reliable method.",
-                                    "pages": [1],
-                                    "prefix": "",
-                                    "suffix": "",
-                                }
-                            ],
-                            "category_summary": "The paper introduces a reliable method.",
+                            "text": "This paper introduces a reliable method.",
+                            "pages": [1],
+                            "prefix": "",
+                            "suffix": "",
                         }
-                    ]
+                    ],
+                    "category_summary": "The paper introduces a reliable method.",
                 }
-                return SimpleNamespace(status="completed", output_text=json.dumps(payload))
-            return SimpleNamespace(
-                status="completed",
-                output_text="The paper introduces a reliable method.",
-            )
-
-    class FakeAsyncOpenAI:
-        def __init__(self, *, api_key):
-            self.api_key = api_key
-            self.responses = FakeResponses()
-
-    monkeypatch.setattr("paperflux.providers.openai_provider.OpenAI", FakeOpenAI)
-    monkeypatch.setattr("paperflux.providers.openai_provider.AsyncOpenAI", FakeAsyncOpenAI)
+            ]
+        }
+        return SimpleNamespace(status="completed", output_text=json.dumps(payload))
+
+    calls = _install_fake_openai(
+        monkeypatch,
+        responses_create,
+        summary_deltas=["The paper introduces ", "a reliable method."],
+    )
     monkeypatch.chdir(outside_cwd)
 
     result = CliRunner().invoke(
@@ -304,16 +374,20 @@ def test_cli_full_pipeline_with_mocked_openai_and_tiny_pdf(tmp_path, monkeypatch
             str(config_path),
             "--output-dir",
             str(output_dir),
+            "--stream-summary",
             str(pdf_path),
         ],
     )
 
     assert result.exit_code == 0, result.output
-    assert created_vector_stores
-    assert uploaded_vector_stores == ["vs_test"]
-    assert deleted_vector_stores == ["vs_test"]
+    assert calls.created_vector_stores
+    assert calls.uploaded_vector_stores == ["vs_test"]
+    assert calls.deleted_vector_stores == ["vs_test"]
+    response_requests = calls.response_requests
     assert response_requests[0]["tools"][0]["vector_store_ids"] == ["vs_test"]
     assert "contributions" in response_requests[0]["input"][1]["content"]
+    assert response_requests[0]["tool_choice"] == "auto"
+    assert response_requests[0]["parallel_tool_calls"] is True
     assert "Input" in result.output
     assert "Processing" in result.output
     assert "[1/1] Processing paper.pdf" in result.output
@@ -321,6 +395,7 @@ def test_cli_full_pipeline_with_mocked_openai_and_tiny_pdf(tmp_path, monkeypatch
     assert "Uploading and indexing paper.pdf" in result.output
     assert "Extracting quotes with OpenAI" in result.output
     assert "Generating summary" in result.output
+    assert "The paper introduces a reliable method.\n" in result.output
     assert "Cleaning up temporary vector store" in result.output
     assert "Annotating PDF and matching quotes" in result.output
     assert "Writing markdown, quotes, and match report" in result.output
@@ -359,6 +434,7 @@ def test_cli_no_progress_disables_stage_callback(tmp_path, monkeypatch):
         output_dir=None,
         show_progress=True,
         progress_callback=None,
+        token_callback=None,
     ):
         captured["show_progress"] = show_progress
         captured["progress_callback"] = progress_callback
@@ -591,3 +667,311 @@ def test_cli_rejects_quotes_file_with_multiple_pdfs(tmp_path):
 
     assert result.exit_code == 1
     assert "--quotes-file can be used with exactly one PDF." in result.output
+
+
+def test_batch_process_reuses_one_openai_client_across_pdfs(tmp_path, monkeypatch):
+    import asyncio
+
+    from paperflux.config import load
+    from paperflux.orchestrator import batch_process
+
+    config_path = _write_config(tmp_path)
+    pdf_paths = [tmp_path / "first.pdf", tmp_path / "second.pdf"]
+    for pdf_path in pdf_paths:
+        _write_tiny_pdf(pdf_path)
+
+    def responses_create(kwargs):
+        payload = {"categories": [{"name": "contributions", "quotes": [], "category_summary": ""}]}
+        return SimpleNamespace(status="completed", output_text=json.dumps(payload))
+
+    calls = _install_fake_openai(monkeypatch, responses_create)
+
+    results = asyncio.run(batch_process(pdf_paths, load(config_path), show_progress=False))
+
+    assert len(results) == 2
+    assert calls.clients == ["test-key"]
+
+
+def test_openai_provider_extracts_each_category_in_its_own_request(tmp_path, monkeypatch):
+    import asyncio
+
+    from paperflux.config import load
+    from paperflux.providers.openai_provider import OpenAIProvider
+
+    config_path = _write_two_category_config(tmp_path)
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+    category_requests = []
+
+    def responses_create(kwargs):
+        user_msg = kwargs["input"][1]["content"]
+        category_requests.append(user_msg)
+        name = "limitations" if "limitations" in user_msg else "contributions"
+        payload = {
+            "categories": [
+                {
+                    "name": name,
+                    "quotes": [{"text": f"{name} quote", "pages": [1], "prefix": "", "suffix": ""}],
+                    "category_summary": f"{name} summary",
+                }
+            ]
+        }
+        return SimpleNamespace(status="completed", output_text=json.dumps(payload))
+
+    _install_fake_openai(monkeypatch, responses_create)
+
+    result = asyncio.run(OpenAIProvider().analyze_pdf(pdf_path, load(config_path)))
+
+    assert len(category_requests) == 2
+    assert sum("contributions" in msg for msg in category_requests) == 1
+    assert sum("limitations" in msg for msg in category_requests) == 1
+    assert list(result["quotes"]) == ["contributions", "limitations"]
+    assert result["quotes"]["limitations"][0]["text"] == "limitations quote"
+    assert result["key_takeaways"] == "Summary."
+
+
+def test_openai_provider_cancels_other_categories_before_deleting_vector_store(
+    tmp_path, monkeypatch
+):
+    import asyncio
+
+    from paperflux.config import load
+    from paperflux.providers.openai_provider import OpenAIProvider
+
+    config_path = _write_two_category_config(tmp_path)
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+    stores_deleted_at_cancel = []
+
+    async def responses_create(kwargs):
+        if "limitations" in kwargs["input"][1]["content"]:
+            raise RuntimeError("category request failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            stores_deleted_at_cancel.append(list(calls.deleted_vector_stores))
+            raise
+
+    calls = _install_fake_openai(monkeypatch, responses_create)
+
+    with pytest.raises(RuntimeError, match="category request failed"):
+        asyncio.run(OpenAIProvider().analyze_pdf(pdf_path, load(config_path)))
+
+    assert stores_deleted_at_cancel == [[]]
+    assert calls.deleted_vector_stores == ["vs_test"]
+
+
+def test_openai_provider_cancels_upload_before_deleting_vector_store(tmp_path, monkeypatch):
+    import asyncio
+
+    from jinja2 import TemplateNotFound
+
+    from paperflux.config import load
+    from paperflux.providers.openai_provider import OpenAIProvider
+
+    config_path = _write_config(tmp_path)
+    (tmp_path / "prompts" / "category.j2").unlink()
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+    stores_deleted_at_cancel = []
+
+    async def slow_upload():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            stores_deleted_at_cancel.append(list(calls.deleted_vector_stores))
+            raise
+
+    calls = _install_fake_openai(monkeypatch, lambda kwargs: None, upload=slow_upload)
+
+    with pytest.raises(TemplateNotFound):
+        asyncio.run(OpenAIProvider().analyze_pdf(pdf_path, load(config_path)))
+
+    assert stores_deleted_at_cancel == [[]]
+    assert calls.deleted_vector_stores == ["vs_test"]
+    assert calls.response_requests == []
+
+
+def test_openai_provider_reports_truncated_summary_stream(tmp_path, monkeypatch):
+    import asyncio
+
+    from paperflux.config import load
+    from paperflux.providers.openai_provider import OpenAIProvider
+
+    config_path = _write_config(tmp_path)
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+
+    def responses_create(kwargs):
+        payload = {"categories": [{"name": "contributions", "quotes": [], "category_summary": ""}]}
+        return SimpleNamespace(status="completed", output_text=json.dumps(payload))
+
+    incomplete_event = SimpleNamespace(
+        type="response.incomplete",
+        response=SimpleNamespace(
+            status="incomplete",
+            incomplete_details=SimpleNamespace(reason="max_output_tokens"),
+            output_text="Partial",
+        ),
+    )
+    calls = _install_fake_openai(
+        monkeypatch,
+        responses_create,
+        summary_deltas=["Partial"],
+        summary_terminal_event=incomplete_event,
+    )
+
+    with pytest.raises(
+        ValueError,
+        match=r"Summary response ended with status='incomplete' "
+        r"\(reason='max_output_tokens'\)\. Consider increasing ui\.max_output_tokens",
+    ):
+        asyncio.run(OpenAIProvider().analyze_pdf(pdf_path, load(config_path)))
+    assert calls.deleted_vector_stores == ["vs_test"]
+
+
+def test_batch_process_overlaps_pdfs_and_keeps_input_order(tmp_path, monkeypatch):
+    import asyncio
+
+    from paperflux import orchestrator
+    from paperflux.config import load
+
+    config_path = _write_config(tmp_path)
+    pdf_paths = [tmp_path / f"paper{i}.pdf" for i in range(3)]
+    in_flight = []
+    peak = []
+
+    async def fake_analyze_pdf(pdf_path, cfg, **kwargs):
+        in_flight.append(pdf_path)
+        peak.append(len(in_flight))
+        # Later PDFs finish first, so ordering must come from the input list.
+        await asyncio.sleep(0.01 * (len(pdf_paths) - pdf_paths.index(pdf_path)))
+        in_flight.remove(pdf_path)
+        return {"key_takeaways": pdf_path.stem, "quotes": {}}
+
+    def fake_finalize_output(pdf_path, quotes, md_note, cfg, **kwargs):
+        return (pdf_path, pdf_path.with_suffix(".md"), pdf_path, pdf_path)
+
+    monkeypatch.setattr(orchestrator, "analyze_pdf", fake_analyze_pdf)
+    monkeypatch.setattr(orchestrator, "finalize_output", fake_finalize_output)
+
+    results = asyncio.run(
+        orchestrator.batch_process(
+            pdf_paths, load(config_path), show_progress=False, max_concurrency=2
+        )
+    )
+
+    assert [result[0] for result in results] == pdf_paths
+    assert max(peak) == 2
+
+
+def test_annotate_pdf_appends_annotations_to_unchanged_input_bytes(tmp_path):
+    from paperflux.io_pdf import annotate_pdf
+
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+    original = pdf_path.read_bytes()
+
+    output_path, report = annotate_pdf(
+        pdf_path,
+        {"contributions": [{"text": "introduces a reliable method", "pages": [1]}]},
+        "Summary.",
+        colors={"contributions": [1.0, 1.0, 0.0]},
+    )
+
+    assert report["matched"] == 1
+    assert pdf_path.read_bytes() == original
+    # Incremental save: the input bytes are kept and the annotations appended.
+    assert output_path.read_bytes().startswith(original)
+    with fitz.open(output_path) as annotated:
+        assert [annot.type[1] for annot in annotated[0].annots()] == ["Text", "Highlight"]
+
+
+def test_annotate_pdf_falls_back_to_full_rewrite_when_incremental_save_fails(
+    tmp_path, monkeypatch
+):
+    from paperflux.io_pdf import annotate_pdf
+
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+    original_save = fitz.Document.save
+
+    def save_without_incremental(self, *args, **kwargs):
+        if kwargs.get("incremental"):
+            raise RuntimeError("incremental save failed")
+        return original_save(self, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Document, "save", save_without_incremental)
+
+    output_path, report = annotate_pdf(
+        pdf_path,
+        {"contributions": [{"text": "introduces a reliable method", "pages": [1]}]},
+        "Summary.",
+        colors={"contributions": [1.0, 1.0, 0.0]},
+    )
+
+    assert report["matched"] == 1
+    with fitz.open(output_path) as annotated:
+        assert [annot.type[1] for annot in annotated[0].annots()] == ["Text", "Highlight"]
+
+
+def test_annotate_pdf_keeps_previous_output_when_save_or_annotation_fails(
+    tmp_path, monkeypatch
+):
+    from paperflux import io_pdf
+
+    pdf_path = tmp_path / "paper.pdf"
+    _write_tiny_pdf(pdf_path)
+    quotes = {"contributions": [{"text": "introduces a reliable method", "pages": [1]}]}
+    colors = {"contributions": [1.0, 1.0, 0.0]}
+    output_path, report = io_pdf.annotate_pdf(pdf_path, quotes, "Summary.", colors=colors)
+    assert report["pdf_saved"] is True
+    previous = output_path.read_bytes()
+
+    def failing_save(self, *args, **kwargs):
+        raise RuntimeError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(fitz.Document, "save", failing_save)
+        _, report = io_pdf.annotate_pdf(pdf_path, quotes, "Summary.", colors=colors)
+    assert report["pdf_saved"] is False
+    assert output_path.read_bytes() == previous
+
+    def failing_locate(*args, **kwargs):
+        raise RuntimeError("matcher crashed")
+
+    monkeypatch.setattr(io_pdf, "locate_quotes_in_document", failing_locate)
+    with pytest.raises(RuntimeError, match="matcher crashed"):
+        io_pdf.annotate_pdf(pdf_path, quotes, "Summary.", colors=colors)
+    assert output_path.read_bytes() == previous
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["paper.pdf", "paper_annotated.pdf"]
+
+
+@pytest.mark.parametrize("content", [b"not a pdf", b""])
+def test_annotate_pdf_rejects_unreadable_input_without_writing_output(tmp_path, content):
+    from paperflux.io_pdf import annotate_pdf
+
+    pdf_path = tmp_path / "bad.pdf"
+    pdf_path.write_bytes(content)
+
+    with pytest.raises(fitz.FileDataError, match="bad.pdf"):
+        annotate_pdf(pdf_path, {}, "Summary.", colors={})
+    assert [p.name for p in tmp_path.iterdir()] == ["bad.pdf"]
+
+
+def test_prompt_caches_follow_working_directory_for_relative_paths(tmp_path, monkeypatch):
+    from paperflux.providers.base import load_template, load_text_file
+
+    for name in ("a", "b"):
+        prompts_dir = tmp_path / name / "prompts"
+        prompts_dir.mkdir(parents=True)
+        (prompts_dir / "summary.j2").write_text(f"template {name}")
+        (prompts_dir / "system.txt").write_text(f"system {name}")
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert load_template("prompts/summary.j2").render() == "template a"
+    assert load_text_file("prompts/system.txt") == "system a"
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert load_template("prompts/summary.j2").render() == "template b"
+    assert load_text_file("prompts/system.txt") == "system b"
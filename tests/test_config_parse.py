@@ -1,5 +1,6 @@
 import pytest
 
+from paperflux import config
 from paperflux.config import Config, load
 
 def test_config_parse(tmp_path):
@@ -23,6 +24,9 @@ matching:
   min_similarity: 0.9
   max_window_tokens: 120
 
+io:
+  save_garbage_level: 4
+
 rag:
   category_prompt_file: "prompts/rag_category_prompt.j2"
   summary_prompt_file: "prompts/rag_summary_prompt.j2"
@@ -45,6 +49,7 @@ rag:
     assert cfg.ui.highlight_colors["contributions"] == [1.0, 1.0, 0.0]
     assert cfg.matching.min_similarity == 0.9
     assert cfg.matching.max_window_tokens == 120
+    assert cfg.io.save_garbage_level == 4
     assert cfg.rag.category_prompt_file == "prompts/rag_category_prompt.j2"
     assert cfg.rag.summary_prompt_file == "prompts/rag_summary_prompt.j2"
     assert cfg.rag.max_num_results == 7
@@ -212,3 +217,74 @@ rag:
     message = str(excinfo.value)
     assert "PAPERFLUX_OPENAI_API_KEY" in message
     assert "export PAPERFLUX_OPENAI_API_KEY=..." in message
+
+
+def test_load_caches_until_file_or_env_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAPERFLUX_OPENAI_API_KEY", "first-key")
+    config_content = """
+openai:
+  api_key: "ENV:PAPERFLUX_OPENAI_API_KEY"
+  model: "gpt-5.4-mini"
+
+ui:
+  detail_level: "medium"
+  highlight_colors:
+    contributions: [1.0, 1.0, 0.0]
+
+extraction_categories:
+  categories:
+    contributions: "..."
+"""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(config_content)
+
+    cfg = load(config_file)
+    assert load(config_file) is cfg
+
+    monkeypatch.setenv("PAPERFLUX_OPENAI_API_KEY", "second-key")
+    env_changed = load(config_file)
+    assert env_changed is not cfg
+    assert env_changed.openai.api_key == "second-key"
+
+    config_file.write_text(config_content.replace('"medium"', '"high"'))
+    file_changed = load(config_file)
+    assert file_changed is not env_changed
+    assert file_changed.ui.detail_level == "high"
+
+    # Each reload replaced the file's entry, so superseded configs are not kept.
+    cached_configs = [entry[2] for entry in config._LOAD_CACHE.values()]
+    assert file_changed in cached_configs
+    assert not any(entry is cfg or entry is env_changed for entry in cached_configs)
+
+
+def test_cached_config_resolves_paths_against_its_own_directory(tmp_path, monkeypatch):
+    from paperflux.providers.base import resolve_config_path
+
+    config_dir = tmp_path / "a"
+    other_dir = tmp_path / "b"
+    config_dir.mkdir()
+    other_dir.mkdir()
+    (config_dir / "config.yaml").write_text(
+        """
+openai:
+  api_key: "testkey"
+  model: "gpt-5.4-mini"
+
+ui:
+  detail_level: "medium"
+  highlight_colors:
+    contributions: [1.0, 1.0, 0.0]
+
+extraction_categories:
+  categories:
+    contributions: "..."
+"""
+    )
+
+    monkeypatch.chdir(config_dir)
+    cfg = load("config.yaml")
+    monkeypatch.chdir(other_dir)
+    cached = load(config_dir / "config.yaml")
+
+    assert cached is cfg
+    assert resolve_config_path("prompts/x.j2", cached) == config_dir.resolve() / "prompts/x.j2"
@@ -1,4 +1,12 @@
-from paperflux.quote_locator import locate_quote_in_words, normalize_token
+import fitz
+
+from paperflux.quote_locator import (
+    QuoteQuery,
+    locate_quote_in_document,
+    locate_quotes_in_document,
+    locate_quote_in_words,
+    normalize_token,
+)
 
 
 def _word(x0, y0, x1, y1, text, block=0, line=0, word_no=0):
@@ -142,3 +150,71 @@ def test_layout_gap_match_skips_intervening_table_or_figure_words():
     assert "speech generated" not in match.matched_text
     assert match.matched_text.endswith("speech does not sufficiently excite the acoustic response.")
     assert len(match.areas) == 5
+
+
+def test_document_search_reuses_page_cache_across_quotes():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "An unrelated opening page.", fontsize=12)
+    doc.new_page().insert_text((72, 72), "The proposed approach is fast.", fontsize=12)
+    page_cache = {}
+
+    first = locate_quote_in_document(doc, "approach is fast", page_cache=page_cache)
+    cached_pages = dict(page_cache)
+    second = locate_quote_in_document(doc, "unrelated opening page", page_cache=page_cache)
+    doc.close()
+
+    assert first is not None and first.page_index == 1
+    assert second is not None and second.page_index == 0
+    assert set(cached_pages) == {0, 1}
+    assert all(page_cache[index] is cached_pages[index] for index in cached_pages)
+
+
+def test_batch_document_search_matches_per_quote_search():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "The proposed approach is fast.", fontsize=12)
+    doc.new_page().insert_text((72, 72), "The proposed approach is fast and simple.", fontsize=12)
+    queries = [
+        QuoteQuery(text="approach is fast and simple"),
+        QuoteQuery(text="proposed approach is fast", page_hints=[2]),
+        QuoteQuery(text="nothing like this appears anywhere"),
+    ]
+
+    batched = locate_quotes_in_document(doc, queries)
+    individual = [
+        locate_quote_in_document(doc, query.text, page_hints=list(query.page_hints))
+        for query in queries
+    ]
+    doc.close()
+
+    assert [m.page_index if m else None for m in batched] == [1, 1, None]
+    assert batched == individual
+
+
+def test_batch_document_search_shares_result_for_duplicate_quotes():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "The proposed approach is fast.", fontsize=12)
+    queries = [
+        QuoteQuery(text="approach is fast", page_hints=[1]),
+        QuoteQuery(text="approach is fast", page_hints=(1,)),
+    ]
+
+    first, second = locate_quotes_in_document(doc, queries)
+    doc.close()
+
+    assert first is not None and first.page_index == 0
+    assert second is first
+
+
+def test_exact_match_budget_stops_document_search_early():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Unrelated words before the approach is fast.", fontsize=12)
+    doc.new_page().insert_text((72, 72), "We show that the approach is fast.", fontsize=12)
+    query = QuoteQuery(text="the approach is fast", prefix="we show that")
+
+    (best,) = locate_quotes_in_document(doc, [query])
+    (budgeted,) = locate_quotes_in_document(doc, [query], max_exact_matches=1)
+    doc.close()
+
+    assert best is not None and best.page_index == 1
+    assert budgeted is not None and budgeted.page_index == 0
+    assert budgeted.method == "exact"